@@ -5,7 +5,15 @@
 # use it only in accordance with the terms of the license agreement you entered
 # into with Aliyun.com .
 # -------------------------------------------------------------------------------
+import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.meta_cache import ApiMetaCache
+
+logger = logging.getLogger(__name__)
 
 API_META_KEYS = (VERSION, RESPONSES, SCHEMA, PROPERTIES, HTTP_SUCCESS_CODE, DEFAULT_VERSION, CODE, REF, APIS,
                  SERVICE_KEY, NAME, IN, PARAMETERS, STYLE, BODY) \
@@ -13,6 +21,47 @@ API_META_KEYS = (VERSION, RESPONSES, SCHEMA, PROPERTIES, HTTP_SUCCESS_CODE, DEFA
        'name', 'in', 'parameters', 'style', 'body')
 
 
+class ProductCatalog:
+    """
+    products.json 及各 overview 的字典索引，加载一次后所有查询均为 O(1)。
+    services: 小写 service code -> (标准 service code, 默认版本, style)
+    apis: (标准 service code, version) -> {小写 api 名称: 标准 api 名称}
+    overviews: (标准 service code, version) -> overview，用于解析 $ref
+    """
+
+    def __init__(self, products):
+        self.products = products
+        self.services = {}
+        for item in products:
+            code = item.get(CODE)
+            if code:
+                self.services.setdefault(code.lower(), (code, item.get(DEFAULT_VERSION), item.get(STYLE)))
+        self._apis = {}
+        self._overviews = {}
+        self._lock = threading.Lock()
+
+    def get_service(self, service):
+        return self.services.get(service.lower()) if service else None
+
+    def get_overview(self, service_standard, version, load_overview):
+        key = (service_standard, version)
+        overview = self._overviews.get(key)
+        if overview is None:
+            overview = load_overview(service_standard, version)
+            with self._lock:
+                overview = self._overviews.setdefault(key, overview)
+        return overview
+
+    def get_api_index(self, service_standard, version, load_overview):
+        key = (service_standard, version)
+        index = self._apis.get(key)
+        if index is None:
+            apis = self.get_overview(service_standard, version, load_overview).get(APIS, {})
+            index = {api_name.lower(): api_name for api_name in apis}
+            with self._lock:
+                index = self._apis.setdefault(key, index)
+        return index
+
 
 class ApiMetaClient:
     PATH = 'path'
@@ -28,6 +77,96 @@ class ApiMetaClient:
         'GetAPIDocs': {'path': 'products/{service}/versions/{version}/api-docs.json'},
     }
 
+    cache = ApiMetaCache()
+    # 离线快照，设置后优先从快照中读取元数据
+    snapshot = None
+    _catalog = None
+    # 只由本地快照/缓存构建的索引，供启动阶段的 get_local_api_meta 使用
+    _local_catalog = None
+    _catalog_lock = threading.Lock()
+    # (service, api, params_in) -> 展开后的参数列表
+    _api_parameters = {}
+
+    # HTTP 连接池配置，可通过 configure_http 调整
+    pool_size = 10
+    connect_timeout = 3.05
+    read_timeout = 10
+    max_retries = 3
+    backoff_factor = 0.3
+    _session = None
+    _session_lock = threading.Lock()
+
+    @classmethod
+    def configure_http(cls, pool_size=None, connect_timeout=None, read_timeout=None, max_retries=None):
+        with cls._session_lock:
+            if pool_size is not None:
+                cls.pool_size = pool_size
+            if connect_timeout is not None:
+                cls.connect_timeout = connect_timeout
+            if read_timeout is not None:
+                cls.read_timeout = read_timeout
+            if max_retries is not None:
+                cls.max_retries = max_retries
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = None
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        session = cls._session
+        if session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    retry = Retry(
+                        total=cls.max_retries,
+                        connect=cls.max_retries,
+                        read=cls.max_retries,
+                        status=cls.max_retries,
+                        backoff_factor=cls.backoff_factor,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset(['GET']),
+                        raise_on_status=False
+                    )
+                    adapter = HTTPAdapter(pool_connections=cls.pool_size, pool_maxsize=cls.pool_size,
+                                          max_retries=retry)
+                    session = requests.Session()
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    cls._session = session
+                session = cls._session
+        return session
+
+    @classmethod
+    def set_cache(cls, cache: ApiMetaCache):
+        cls.cache = cache
+        cls.reset_catalog()
+
+    @classmethod
+    def set_snapshot(cls, snapshot):
+        cls.snapshot = snapshot
+        cls.reset_catalog()
+
+    @classmethod
+    def reset_catalog(cls):
+        with cls._catalog_lock:
+            cls._catalog = None
+            cls._local_catalog = None
+            cls._api_parameters = {}
+
+    @classmethod
+    def get_catalog(cls) -> ProductCatalog:
+        catalog = cls._catalog
+        if catalog is None:
+            with cls._catalog_lock:
+                if cls._catalog is None:
+                    cls._catalog = ProductCatalog(cls.get_response_from_pop_api(cls.GET_PRODUCT_LIST))
+                catalog = cls._catalog
+        return catalog
+
+    @classmethod
+    def _load_api_overview(cls, service_standard, version):
+        return cls.get_response_from_pop_api(cls.GET_API_OVERVIEW, service=service_standard, version=version)
+
     @classmethod
     def get_response_from_pop_api(cls, pop_api_name, service=None, api=None, version=None):
         url = None  # 提前定义，防止 except 中引用未定义变量
@@ -39,41 +178,110 @@ class ApiMetaClient:
                 raise Exception(f'Failed to format path, path: {api_config.get(cls.PATH)}, error: {e}')
 
             url = f'{cls.BASE_URL}/{formatted_path}'
-            response = requests.get(url)
-            return response.json()
+            if cls.snapshot is not None:
+                data = cls.snapshot.get(formatted_path)
+                if data is not None:
+                    return data
+            entry = cls.cache.get(formatted_path)
+            if entry is not None and cls.cache.is_fresh(entry, pop_api_name):
+                return entry['data']
+            headers = cls.cache.validators(entry) if entry is not None else {}
+            try:
+                response = cls.get_session().get(url, headers=headers,
+                                                 timeout=(cls.connect_timeout, cls.read_timeout))
+            except Exception as e:
+                if entry is None:
+                    raise
+                # 元数据服务不可用时使用过期缓存
+                logger.warning(f'Failed to revalidate api meta, use stale cache, url: {url}, error: {e}')
+                return entry['data']
+            if response.status_code == 304 and entry is not None:
+                return cls.cache.touch(formatted_path)['data']
+            if not 200 <= response.status_code < 300:
+                if entry is None:
+                    raise Exception(f'Unexpected status code: {response.status_code}')
+                # 错误响应不作为元数据返回，使用过期缓存
+                logger.warning(f'Failed to revalidate api meta, use stale cache, url: {url}, '
+                               f'status code: {response.status_code}')
+                return entry['data']
+            data = response.json()
+            cls.cache.put(formatted_path, data,
+                          etag=response.headers.get('ETag'),
+                          last_modified=response.headers.get('Last-Modified'))
+            return data
         except Exception as e:
             raise Exception(f'Failed to get response from pop api, url: {url}, error: {e}')
 
+    @classmethod
+    def peek_response_from_pop_api(cls, pop_api_name, service=None, api=None, version=None):
+        """只从离线快照或本地缓存读取元数据（不校验是否过期），不发起网络请求，未命中返回 None"""
+        formatted_path = cls.config[pop_api_name][cls.PATH].format(service=service, api=api, version=version)
+        if cls.snapshot is not None:
+            data = cls.snapshot.get(formatted_path)
+            if data is not None:
+                return data
+        entry = cls.cache.get(formatted_path)
+        return entry['data'] if entry is not None else None
+
+    @classmethod
+    def _peek_api_overview(cls, service_standard, version):
+        overview = cls.peek_response_from_pop_api(cls.GET_API_OVERVIEW, service=service_standard, version=version)
+        if overview is None:
+            # 不缓存未命中，本地缓存写入后可以再次查询
+            raise LookupError(f'No local api overview of {service_standard} {version}')
+        return overview
+
+    @classmethod
+    def get_local_api_meta(cls, service, api):
+        """只使用本地数据获取 API META，用于启动阶段的懒加载，未命中返回 None"""
+        catalog = cls._local_catalog
+        if catalog is None:
+            products = cls.peek_response_from_pop_api(cls.GET_PRODUCT_LIST)
+            if products is None:
+                return None
+            with cls._catalog_lock:
+                if cls._local_catalog is None:
+                    cls._local_catalog = ProductCatalog(products)
+                catalog = cls._local_catalog
+        service_info = catalog.get_service(service)
+        if service_info is None:
+            return None
+        service_standard, version, _ = service_info
+        try:
+            api_index = catalog.get_api_index(service_standard, version, cls._peek_api_overview)
+        except LookupError:
+            return None
+        api_standard = api_index.get(api.lower())
+        if api_standard is None:
+            return None
+        return cls.peek_response_from_pop_api(cls.GET_API_INFO, service_standard, api_standard, version)
+
     @classmethod
     def get_service_version(cls, service):
-        data = cls.get_response_from_pop_api(cls.GET_PRODUCT_LIST)
-        version = next((item.get(DEFAULT_VERSION) for item in data if item.get(CODE).lower() == service.lower()), None)
-        return version
+        service_info = cls.get_catalog().get_service(service)
+        return service_info[1] if service_info else None
 
     @classmethod
     def get_all_service_info(cls):
-        data = cls.get_response_from_pop_api(cls.GET_PRODUCT_LIST)
+        data = cls.get_catalog().products
         filtered_data = [{"code": item["code"], "name": item["name"]} for item in data]
 
         return filtered_data
 
     @classmethod
     def get_service_style(cls, service):
-        data = cls.get_response_from_pop_api(cls.GET_PRODUCT_LIST)
-        style = next((item.get(STYLE) for item in data if item.get(CODE).lower() == service), 'RPC')
-        return style
+        service_info = cls.get_catalog().get_service(service)
+        return service_info[2] if service_info else 'RPC'
 
     @classmethod
     def get_standard_service_and_api(cls, service, api=None, version=None):
-        data = cls.get_response_from_pop_api(cls.GET_PRODUCT_LIST)
-        service_standard = (next((item.get(CODE) for item in data if item.get(CODE).lower() == service), None))
+        catalog = cls.get_catalog()
+        service_info = catalog.get_service(service)
+        service_standard = service_info[0] if service_info else None
         api_standard = None
-        if api:
-            apis = cls.get_response_from_pop_api(cls.GET_API_OVERVIEW, service=service_standard,
-                                                 version=version).get(APIS, {})
-            for api_name in apis:
-                if api_name.lower() == api.lower():
-                    api_standard = api_name
+        if api and service_standard:
+            api_index = catalog.get_api_index(service_standard, version, cls._load_api_overview)
+            api_standard = api_index.get(api.lower())
         return service_standard, api_standard
 
     @classmethod
@@ -98,8 +306,10 @@ class ApiMetaClient:
 
     @classmethod
     def get_ref_api_meta(cls, data, service, version):
-        service_standard, _ = cls.get_standard_service_and_api(service=service, version=version)
-        current_data = cls.get_response_from_pop_api(cls.GET_API_OVERVIEW, service=service_standard, version=version)
+        catalog = cls.get_catalog()
+        service_info = catalog.get_service(service)
+        service_standard = service_info[0] if service_info else None
+        current_data = catalog.get_overview(service_standard, version, cls._load_api_overview)
         ref_path = data.get(REF)
         path = ref_path.lstrip('#/').split('/')
         for _key in path:
@@ -115,14 +325,23 @@ class ApiMetaClient:
         """
         params_in: 过滤参数位置，取值：'host', 'query', 'body', 'header'，若为空，则返回所有参数
         """
-        api_meta, _ = cls.get_api_meta(service, api)
+        cache_key = (service.lower(), api.lower(), params_in)
+        combined_params = cls._api_parameters.get(cache_key)
+        if combined_params is None:
+            combined_params = cls._resolve_api_parameters(service, api, params_in)
+            cls._api_parameters[cache_key] = combined_params
+        return list(combined_params)
+
+    @classmethod
+    def _resolve_api_parameters(cls, service, api, params_in=''):
+        api_meta, version = cls.get_api_meta(service, api)
         parameters = api_meta.get(PARAMETERS)
         param_names = []
         additional_props = []
         # 避免循环引用
         visited_refs = set()
 
-        def get_ref(data, _):
+        def get_ref(data):
             props = []
             if not isinstance(data, dict):
                 return props
@@ -131,14 +350,14 @@ class ApiMetaClient:
                 if ref_path in visited_refs:
                     return props
                 visited_refs.add(ref_path)
-                referenced_schema = cls.get_ref_api_meta(data, service, _)
-                props.extend(get_ref(referenced_schema, _))
+                referenced_schema = cls.get_ref_api_meta(data, service, version)
+                props.extend(get_ref(referenced_schema))
                 return props
             if PROPERTIES in data:
                 for prop_name, prop_details in data.get(PROPERTIES, {}).items():
                     props.append(prop_name)
                     if isinstance(prop_details, dict) and REF in prop_details:
-                        props.extend(get_ref(prop_details, _))
+                        props.extend(get_ref(prop_details))
             return props
 
         for param in parameters:
@@ -148,7 +367,7 @@ class ApiMetaClient:
             if param_name:
                 param_names.append(param_name)
             schema = param.get(SCHEMA, {})
-            extracted_props = get_ref(schema, _)
+            extracted_props = get_ref(schema)
             additional_props.extend(extracted_props)
         combined_params = param_names + additional_props
         return combined_params
@@ -156,7 +375,8 @@ class ApiMetaClient:
     @classmethod
     def get_apis_in_service(cls, service):
         version = cls.get_service_version(service)
-        data = cls.get_response_from_pop_api(cls.GET_API_OVERVIEW, service=service, version=version)
+        service_standard, _ = cls.get_standard_service_and_api(service)
+        data = cls._load_api_overview(service_standard or service, version)
         apis = list(data[APIS].keys())
         return apis
 
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkScheduler:
+    """
+    将大批量目标按 chunk_size 切分后并发执行：全局最多 max_concurrency 个分片同时执行，
+    分片的启动速率不超过 rate（每秒，0 表示不限）；func 抛出异常的分片最多重试 max_retries 次（默认不重试），
+    已成功的分片不会重复执行。
+    """
+
+    def __init__(self, chunk_size=100, max_concurrency=10, rate=2.0, max_retries=0):
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket = TokenBucket(rate) if rate > 0 else None
+
+    def configure(self, chunk_size=None, max_concurrency=None, rate=None, max_retries=None):
+        if chunk_size is not None:
+            self.chunk_size = max(1, chunk_size)
+        if max_concurrency is not None:
+            self.max_concurrency = max(1, max_concurrency)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if rate is not None:
+            self.rate = rate
+            self._bucket = TokenBucket(rate) if rate > 0 else None
+        if max_retries is not None:
+            self.max_retries = max_retries
+
+    def split(self, items):
+        return [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+
+    @staticmethod
+    async def _notify(on_done, chunk, result, error):
+        if on_done is None:
+            return
+        try:
+            await on_done(chunk, result, error)
+        except Exception as e:
+            logger.info(f'Chunk callback failed: {e}')
+
+    @staticmethod
+    def _releaser(semaphore):
+        """返回可以在任意线程中调用的释放名额回调"""
+        loop = asyncio.get_running_loop()
+
+        def release(_):
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:
+                # 事件循环已关闭，名额随之失效
+                pass
+
+        return release
+
+    async def _run_chunk(self, func, chunk, final, on_done, hold):
+        semaphore = self._semaphore
+        await semaphore.acquire()
+        try:
+            if self._bucket is not None:
+                await self._bucket.acquire_async()
+            result = await func(chunk)
+        except BaseException as e:
+            semaphore.release()
+            if final and isinstance(e, Exception):
+                await self._notify(on_done, chunk, None, e)
+            raise
+        future = hold(result) if hold is not None else None
+        if future is None:
+            semaphore.release()
+        else:
+            # 分片的执行在后台继续运行时，直到 future 完成才释放并发名额
+            future.add_done_callback(self._releaser(semaphore))
+        await self._notify(on_done, chunk, result, None)
+        return result
+
+    async def run(self, items, func, on_done=None, hold=None):
+        """
+        按分片执行 func(chunk)，func 抛出异常表示该分片可以重试。
+        返回与分片一一对应的 (chunk, result, error) 列表，error 为最后一次执行失败的异常，成功时为 None。
+        on_done(chunk, result, error) 在分片得到最终结果（成功或重试耗尽）时调用。
+        hold(result) 返回 Future 时，该分片占用的并发名额在 Future 完成后才释放。
+        """
+        chunks = self.split(list(items))
+        results = [None] * len(chunks)
+        errors = [None] * len(chunks)
+        pending = list(range(len(chunks)))
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                logger.info(f'Retry {len(pending)} failed chunks (attempt {attempt}/{self.max_retries})')
+            final = attempt == self.max_retries
+            outcomes = await asyncio.gather(*[self._run_chunk(func, chunks[i], final, on_done, hold)
+                                              for i in pending],
+                                            return_exceptions=True)
+            failed = []
+            for i, outcome in zip(pending, outcomes):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                if isinstance(outcome, Exception):
+                    errors[i] = outcome
+                    failed.append(i)
+                else:
+                    results[i], errors[i] = outcome, None
+            pending = failed
+            if not pending:
+                break
+        return list(zip(chunks, results, errors))
+
+
+chunk_scheduler = ChunkScheduler()
@@ -0,0 +1,65 @@
+import time
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class ClientPool:
+    """
+    SDK Client 的 LRU 连接池，复用 Client 以保持 HTTP keep-alive 连接。
+    key 一般为 (client 类型, service, endpoint, 凭证指纹)，空闲超过 idle_timeout 的 Client 会被淘汰。
+    """
+
+    def __init__(self, max_size=64, idle_timeout=300):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, max_size=None, idle_timeout=None):
+        with self._lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout
+            self._evict(time.monotonic())
+
+    def get(self, key, factory):
+        now = time.monotonic()
+        with self._lock:
+            item = self._clients.get(key)
+            if item is not None and now - item[1] <= self.idle_timeout:
+                self._clients[key] = (item[0], now)
+                self._clients.move_to_end(key)
+                return item[0]
+        client = factory()
+        if self.max_size <= 0:
+            return client
+        with self._lock:
+            item = self._clients.get(key)
+            if item is not None and now - item[1] <= self.idle_timeout:
+                client = item[0]
+            self._clients[key] = (client, now)
+            self._clients.move_to_end(key)
+            self._evict(now)
+        return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self):
+        return len(self._clients)
+
+    def _evict(self, now):
+        # 按最近使用排序，先淘汰空闲超时的，再淘汰超出容量的
+        for key in [key for key, (_, last_used) in self._clients.items() if now - last_used > self.idle_timeout]:
+            del self._clients[key]
+        while len(self._clients) > max(self.max_size, 0):
+            key, _ = self._clients.popitem(last=False)
+            logger.debug(f'Evict pooled client: {key}')
+
+
+client_pool = ClientPool()
@@ -0,0 +1,128 @@
+import time
+import logging
+import threading
+
+from alibabacloud_credentials.client import Client as CredClient
+from alibabacloud_credentials.models import CredentialModel
+
+logger = logging.getLogger(__name__)
+
+
+class CachedCredentialsClient(CredClient):
+    """
+    进程级共享的默认凭证链 Client。
+    凭证解析一次后缓存；STS 类凭证在过期前 refresh_ahead 秒内由后台线程提前刷新，调用方不会阻塞在凭证刷新上。
+    """
+
+    def __init__(self, refresh_ahead=300, default_sts_ttl=900, **kwargs):
+        super().__init__(**kwargs)
+        self.refresh_ahead = refresh_ahead
+        # 无法从 provider 获取过期时间时，STS 凭证的默认有效期
+        self.default_sts_ttl = default_sts_ttl
+        self._credential = None
+        self._expires_at = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def _to_model(self, credentials) -> CredentialModel:
+        return CredentialModel(
+            access_key_id=credentials.get_access_key_id(),
+            access_key_secret=credentials.get_access_key_secret(),
+            security_token=credentials.get_security_token(),
+            type=getattr(self.cloud_credential, 'type_name', None),
+            provider_name=credentials.get_provider_name(),
+        )
+
+    @staticmethod
+    def _get_expiration(credentials):
+        try:
+            return credentials.get_expiration()
+        except Exception:
+            return None
+
+    def _store(self, credential: CredentialModel, expiration=None) -> CredentialModel:
+        expires_at = None
+        if credential.security_token:
+            expires_at = expiration or time.time() + self.default_sts_ttl
+        with self._lock:
+            self._credential = credential
+            self._expires_at = expires_at
+        return credential
+
+    def _refresh(self) -> CredentialModel:
+        # 凭证与过期时间取自同一次 provider 调用
+        provider = getattr(self.cloud_credential, 'provider', None)
+        if provider is None:
+            return self._store(super().get_credential())
+        credentials = provider.get_credentials()
+        return self._store(self._to_model(credentials), self._get_expiration(credentials))
+
+    async def _refresh_async(self) -> CredentialModel:
+        provider = getattr(self.cloud_credential, 'provider', None)
+        if provider is None:
+            return self._store(await super().get_credential_async())
+        credentials = await provider.get_credentials_async()
+        return self._store(self._to_model(credentials), self._get_expiration(credentials))
+
+    def _refresh_in_background(self):
+        try:
+            self._refresh()
+        except Exception as e:
+            logger.warning(f'Failed to refresh credential in background: {e}')
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _get_cached(self):
+        """返回仍然可用的缓存凭证，临近过期时触发后台刷新；需要同步刷新时返回 None"""
+        with self._lock:
+            credential, expires_at = self._credential, self._expires_at
+            now = time.time()
+            if credential is not None and (expires_at is None or now < expires_at - self.refresh_ahead):
+                return credential
+            if credential is None or now >= expires_at:
+                return None
+            if self._refreshing:
+                # 后台刷新进行中，旧凭证仍然有效
+                return credential
+            self._refreshing = True
+        threading.Thread(target=self._refresh_in_background, daemon=True).start()
+        return credential
+
+    def get_credential(self) -> CredentialModel:
+        return self._get_cached() or self._refresh()
+
+    async def get_credential_async(self) -> CredentialModel:
+        # 首次获取或凭证已过期时异步刷新，不阻塞事件循环
+        return self._get_cached() or await self._refresh_async()
+
+    def get_access_key_id(self):
+        return self.get_credential().access_key_id
+
+    async def get_access_key_id_async(self):
+        return (await self.get_credential_async()).access_key_id
+
+    def get_access_key_secret(self):
+        return self.get_credential().access_key_secret
+
+    async def get_access_key_secret_async(self):
+        return (await self.get_credential_async()).access_key_secret
+
+    def get_security_token(self):
+        return self.get_credential().security_token
+
+    async def get_security_token_async(self):
+        return (await self.get_credential_async()).security_token
+
+
+_credentials_client = None
+_credentials_client_lock = threading.Lock()
+
+
+def get_credentials_client() -> CachedCredentialsClient:
+    global _credentials_client
+    if _credentials_client is None:
+        with _credentials_client_lock:
+            if _credentials_client is None:
+                _credentials_client = CachedCredentialsClient()
+    return _credentials_client
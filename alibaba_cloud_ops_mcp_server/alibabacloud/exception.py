@@ -4,6 +4,30 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+THROTTLING_ERROR_CODE_PREFIX = 'Throttling'
+
+
+def get_error_code(error):
+    code = getattr(error, 'code', None)
+    if code is None and isinstance(getattr(error, 'data', None), dict):
+        code = error.data.get('Code')
+    return code
+
+
+def get_status_code(error):
+    status_code = getattr(error, 'statusCode', None) or getattr(error, 'status_code', None)
+    if status_code is None and isinstance(getattr(error, 'data', None), dict):
+        status_code = error.data.get('statusCode')
+    try:
+        return int(status_code) if status_code is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_throttling_error(error) -> bool:
+    """Throttling、Throttling.User、Throttling.Api 等限流错误"""
+    return str(get_error_code(error) or '').startswith(THROTTLING_ERROR_CODE_PREFIX) or get_status_code(error) == 429
+
 
 class AcsException(Exception):
     msg_fmt = 'An unknown exception occurred.'
@@ -44,3 +68,15 @@ class OOSExecutionFailed(AcsException):
     msg_fmt = 'OOS Execution Failed, reason: {reason}.'
     status = 400
     code = 'Execution.Failed'
+
+
+class OOSExecutionNotFound(AcsException):
+    msg_fmt = 'OOS Execution {execution_id} not found.'
+    status = 404
+    code = 'Execution.NotFound'
+
+
+class MultiRegionNotSupported(AcsException):
+    msg_fmt = '{api} is not a read-only API, RegionId must be a single region, got {region_id}.'
+    status = 400
+    code = 'InvalidParameter.RegionId'
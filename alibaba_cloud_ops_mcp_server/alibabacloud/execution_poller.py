@@ -0,0 +1,236 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from alibabacloud_oos20190601 import models as oos_20190601_models
+from alibaba_cloud_ops_mcp_server.alibabacloud.rate_limiter import rate_limiter
+from alibaba_cloud_ops_mcp_server.alibabacloud.retry import retry_policy
+
+logger = logging.getLogger(__name__)
+
+END_STATUSES = ('Success', 'Failed', 'Cancelled')
+
+# ListExecutions 单页最大条数
+MAX_RESULTS = 100
+# 批量查询最多翻页数，超出部分的执行逐个查询
+MAX_BATCH_PAGES = 3
+
+
+class _Watch:
+
+    def __init__(self, client, region_id, execution_id, start_date, interval):
+        self.client = client
+        self.region_id = region_id
+        self.execution_id = execution_id
+        self.start_date = start_date
+        self.interval = interval
+        self.next_check_at = time.monotonic() + interval
+        self.failures = 0
+        self.futures = []
+
+
+class ExecutionPoller:
+    """
+    共享的 OOS 执行状态轮询器：一个后台线程跟踪所有未结束的执行，
+    按 (地域, client) 合并为尽量少的 ListExecutions 请求，执行结束后通过 Future 通知等待方。
+    每个执行的轮询间隔从 initial_interval 开始按 backoff_factor 递增，最长为 max_interval。
+    最近查询到的执行状态按 (client, execution_id) 缓存，供状态查询复用。
+    """
+
+    def __init__(self, initial_interval=1.0, max_interval=15.0, backoff_factor=1.5, max_failures=5,
+                 max_workers=8, max_states=1024):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.max_failures = max_failures
+        self.max_workers = max_workers
+        self.max_states = max_states
+        # execution_id -> _Watch
+        self._watches = {}
+        # (client, execution_id) -> ListExecutionsResponseBodyExecutions
+        self._states = OrderedDict()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._executor = None
+
+    def configure(self, initial_interval=None, max_interval=None):
+        with self._condition:
+            if initial_interval is not None:
+                self.initial_interval = initial_interval
+            if max_interval is not None:
+                self.max_interval = max(max_interval, self.initial_interval)
+
+    def watch(self, client, region_id: str, execution_id: str, start_date: str = None) -> Future:
+        """返回在执行结束时以 ListExecutionsResponseBodyExecutions 完成的 Future"""
+        future = Future()
+        with self._condition:
+            execution = self._states.get((client, execution_id))
+            if execution is not None and execution.status in END_STATUSES:
+                future.set_result(execution)
+                return future
+            watch = self._watches.get(execution_id)
+            if watch is None:
+                watch = _Watch(client, region_id, execution_id, start_date, self.initial_interval)
+                self._watches[execution_id] = watch
+            watch.futures.append(future)
+            self._ensure_started()
+            self._condition.notify()
+        return future
+
+    def unwatch(self, execution_id: str, future: Future = None):
+        """取消等待并取消对应的 Future；没有等待方的执行不再轮询"""
+        with self._condition:
+            watch = self._watches.get(execution_id)
+            if watch is None:
+                return
+            if future is not None and future in watch.futures:
+                watch.futures.remove(future)
+                future.cancel()
+            if future is None or not watch.futures:
+                self._watches.pop(execution_id, None)
+                for pending in watch.futures:
+                    pending.cancel()
+
+    def is_watching(self, execution_id: str) -> bool:
+        return execution_id in self._watches
+
+    def get_state(self, client, execution_id: str):
+        """返回最近一次查询到的执行状态，没有缓存时返回 None"""
+        with self._condition:
+            return self._states.get((client, execution_id))
+
+    def remember(self, client, execution):
+        with self._condition:
+            self._remember(client, execution)
+
+    def _remember(self, client, execution):
+        key = (client, execution.execution_id)
+        self._states[key] = execution
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_states:
+            self._states.popitem(last=False)
+
+    def __len__(self):
+        return len(self._watches)
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='oos-execution-poller')
+            self._thread = threading.Thread(target=self._run, name='oos-execution-poller', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._watches:
+                        self._thread = None
+                        return
+                    now = time.monotonic()
+                    next_check_at = min(watch.next_check_at for watch in self._watches.values())
+                    if next_check_at <= now:
+                        break
+                    self._condition.wait(next_check_at - now)
+                groups = {}
+                for watch in self._watches.values():
+                    groups.setdefault((watch.region_id, watch.client), []).append(watch)
+                # 同一组内的执行由一次批量查询覆盖，只要有一个到期就整组查询
+                groups = {key: watches for key, watches in groups.items()
+                          if any(watch.next_check_at <= now for watch in watches)}
+            for future in [self._executor.submit(self._poll_group, client, region_id, watches)
+                           for (region_id, client), watches in groups.items()]:
+                future.result()
+
+    def _poll_group(self, client, region_id, watches):
+        try:
+            executions = self._list_executions(client, region_id, watches)
+        except Exception as e:
+            logger.warning(f'Poll OOS executions in {region_id} failed: {e}')
+            self._on_error(watches, e)
+            return
+        for watch in watches:
+            self._on_polled(watch, executions.get(watch.execution_id))
+
+    def _list_executions(self, client, region_id, watches):
+        """
+        批量查询执行状态：多个执行从最早的开始时间起按开始时间升序分页查询，最多 MAX_BATCH_PAGES 页，
+        未命中的再逐个查询，避免地域内执行较多时翻遍所有执行
+        """
+        executions = {}
+        pending = {watch.execution_id for watch in watches}
+        dated = [watch.start_date for watch in watches if watch.start_date]
+        if len(pending) > 1 and dated:
+            next_token = None
+            for _ in range(MAX_BATCH_PAGES):
+                request = oos_20190601_models.ListExecutionsRequest(
+                    region_id=region_id,
+                    start_date_after=min(dated),
+                    sort_field='StartDate',
+                    sort_order='Ascending',
+                    max_results=MAX_RESULTS,
+                    next_token=next_token
+                )
+                body = self._call_list_executions(client, region_id, request)
+                for execution in body.executions or []:
+                    executions[execution.execution_id] = execution
+                    pending.discard(execution.execution_id)
+                next_token = body.next_token
+                if not pending or not next_token:
+                    break
+        for execution_id in pending:
+            request = oos_20190601_models.ListExecutionsRequest(region_id=region_id, execution_id=execution_id)
+            for execution in self._call_list_executions(client, region_id, request).executions or []:
+                executions[execution.execution_id] = execution
+        return executions
+
+    @staticmethod
+    def _call_list_executions(client, region_id, request):
+        return retry_policy.call(rate_limiter.call, 'oos', region_id, 'ListExecutions', client.list_executions,
+                                 request).body
+
+    def _on_polled(self, watch, execution):
+        with self._condition:
+            if self._watches.get(watch.execution_id) is not watch:
+                return
+            if execution is None:
+                self._watches.pop(watch.execution_id)
+                self._resolve(watch, error=LookupError(f'Execution {watch.execution_id} not found'))
+                return
+            watch.failures = 0
+            watch.start_date = watch.start_date or execution.start_date
+            self._remember(watch.client, execution)
+            if execution.status in END_STATUSES:
+                self._watches.pop(watch.execution_id)
+                self._resolve(watch, execution=execution)
+                return
+            watch.interval = min(self.max_interval, watch.interval * self.backoff_factor)
+            watch.next_check_at = time.monotonic() + watch.interval
+
+    def _on_error(self, watches, error):
+        with self._condition:
+            for watch in watches:
+                if self._watches.get(watch.execution_id) is not watch:
+                    continue
+                watch.failures += 1
+                if watch.failures >= self.max_failures:
+                    self._watches.pop(watch.execution_id)
+                    self._resolve(watch, error=error)
+                else:
+                    watch.next_check_at = time.monotonic() + watch.interval
+
+    @staticmethod
+    def _resolve(watch, execution=None, error=None):
+        for future in watch.futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(execution)
+
+
+execution_poller = ExecutionPoller()
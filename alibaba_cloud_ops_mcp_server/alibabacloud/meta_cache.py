@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 缓存文件格式版本，格式变更时递增，旧版本缓存会被自动忽略
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'alibaba-cloud-ops-mcp-server')
+
+CACHE_ENTRY_KEYS = (DATA, FETCHED_AT, ETAG, LAST_MODIFIED) = ('data', 'fetched_at', 'etag', 'last_modified')
+
+# 各类元数据的默认有效期（秒）
+DEFAULT_TTLS = {
+    'GetProductList': 24 * 3600,
+    'GetApiOverview': 24 * 3600,
+    'GetApiInfo': 7 * 24 * 3600,
+    'GetAPIDocs': 24 * 3600,
+}
+
+
+class ApiMetaCache:
+    """
+    POP API META 的两级缓存：进程内字典 + 磁盘文件。
+    缓存 key 为元数据的相对路径（如 products/Ecs/versions/2014-05-26/apis/DescribeInstances/api.json），
+    天然包含 service、version 和 api。
+    """
+
+    def __init__(self, cache_dir=None, ttls=None, enabled=True):
+        cache_dir = cache_dir or os.environ.get('ALIBABA_CLOUD_OPS_MCP_META_CACHE_DIR') or DEFAULT_CACHE_DIR
+        self.root = os.path.join(cache_dir, 'meta', f'v{CACHE_FORMAT_VERSION}')
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.enabled = enabled
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _file_path(self, key):
+        return os.path.join(self.root, *key.split('/'))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None or not self.enabled:
+            return entry
+        try:
+            with open(self._file_path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f'Failed to load api meta cache, key: {key}, error: {e}')
+            return None
+        with self._lock:
+            self._entries.setdefault(key, entry)
+        return entry
+
+    def put(self, key, data, etag=None, last_modified=None):
+        entry = {DATA: data, FETCHED_AT: time.time(), ETAG: etag, LAST_MODIFIED: last_modified}
+        with self._lock:
+            self._entries[key] = entry
+        self._write(key, entry)
+        return entry
+
+    def touch(self, key):
+        """服务端返回 304 时刷新缓存时间"""
+        entry = self.get(key)
+        if entry is None:
+            return None
+        entry = dict(entry, **{FETCHED_AT: time.time()})
+        with self._lock:
+            self._entries[key] = entry
+        self._write(key, entry)
+        return entry
+
+    def is_fresh(self, entry, pop_api_name):
+        ttl = self.ttls.get(pop_api_name, 0)
+        return time.time() - entry.get(FETCHED_AT, 0) < ttl
+
+    @staticmethod
+    def validators(entry):
+        """条件请求头，用于过期缓存的重新验证"""
+        headers = {}
+        if entry.get(ETAG):
+            headers['If-None-Match'] = entry[ETAG]
+        if entry.get(LAST_MODIFIED):
+            headers['If-Modified-Since'] = entry[LAST_MODIFIED]
+        return headers
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _write(self, key, entry):
+        if not self.enabled:
+            return
+        path = self._file_path(key)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f'Failed to write api meta cache, key: {key}, error: {e}')
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,92 @@
+import gzip
+import json
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.api_meta_client import ApiMetaClient, APIS
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+SNAPSHOT_KEYS = (FORMAT_VERSION, CREATED_AT, BASE_URL, DOCUMENTS) = \
+    ('format_version', 'created_at', 'base_url', 'documents')
+
+
+class MetaSnapshot:
+    """
+    离线 API META 快照，gzip 压缩的单个 JSON 文件。
+    documents 以元数据相对路径为 key，与 ApiMetaCache 的 key 一致。
+    """
+
+    def __init__(self, documents, created_at=None):
+        self.documents = documents
+        self.created_at = created_at
+
+    def get(self, key):
+        return self.documents.get(key)
+
+    def __contains__(self, key):
+        return key in self.documents
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get(FORMAT_VERSION) != SNAPSHOT_FORMAT_VERSION:
+            raise Exception(f'Unsupported api meta snapshot format: {data.get(FORMAT_VERSION)}, path: {path}')
+        return cls(data.get(DOCUMENTS, {}), data.get(CREATED_AT))
+
+    def dump(self, path):
+        data = {
+            FORMAT_VERSION: SNAPSHOT_FORMAT_VERSION,
+            CREATED_AT: self.created_at or time.time(),
+            BASE_URL: ApiMetaClient.BASE_URL,
+            DOCUMENTS: self.documents
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def _document_key(pop_api_name, service=None, api=None, version=None):
+    return ApiMetaClient.config[pop_api_name][ApiMetaClient.PATH].format(service=service, api=api, version=version)
+
+
+def build_snapshot(services, apis=None, max_workers=8) -> MetaSnapshot:
+    """
+    services: 需要抓取的 service 列表
+    apis: {service: [api]}，为空时抓取 service 下的全部 API
+    """
+    apis = {service.lower(): api_list for service, api_list in (apis or {}).items()}
+    documents = {_document_key(ApiMetaClient.GET_PRODUCT_LIST):
+                 ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_PRODUCT_LIST)}
+    targets = []
+    for service in services:
+        service_standard, _ = ApiMetaClient.get_standard_service_and_api(service)
+        if service_standard is None:
+            logger.warning(f'Skip unknown service when building api meta snapshot: {service}')
+            continue
+        version = ApiMetaClient.get_service_version(service_standard)
+        overview = ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_API_OVERVIEW,
+                                                           service=service_standard, version=version)
+        documents[_document_key(ApiMetaClient.GET_API_OVERVIEW, service=service_standard, version=version)] = overview
+        api_names = apis.get(service.lower()) or list(overview.get(APIS, {}).keys())
+        for api_name in api_names:
+            _, api_standard = ApiMetaClient.get_standard_service_and_api(service_standard, api_name, version)
+            if api_standard is None:
+                logger.warning(f'Skip unknown api when building api meta snapshot: {service}.{api_name}')
+                continue
+            targets.append((service_standard, api_standard, version))
+
+    def fetch(target):
+        service_standard, api_standard, version = target
+        return ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_API_INFO, service_standard,
+                                                       api_standard, version)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for (service_standard, api_standard, version), data in zip(targets, executor.map(fetch, targets)):
+            key = _document_key(ApiMetaClient.GET_API_INFO, service=service_standard, api=api_standard,
+                                version=version)
+            documents[key] = data
+    return MetaSnapshot(documents, time.time())
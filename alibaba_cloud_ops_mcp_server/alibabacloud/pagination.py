@@ -0,0 +1,162 @@
+import math
+import asyncio
+from collections import deque
+
+PAGINATION_STYLES = (PAGE_NUMBER, NEXT_TOKEN) = ('PageNumber', 'NextToken')
+
+PAGE_SIZE_PARAMETERS = {
+    PAGE_NUMBER: 'PageSize',
+    NEXT_TOKEN: 'MaxResults'
+}
+
+TOTAL_COUNT = 'TotalCount'
+
+# 自动翻页时最多返回的条目数，由调用方传入，不会透传给 API
+MAX_ITEMS_FIELD = 'MaxItems'
+
+DEFAULT_PAGE_SIZE = 50
+
+# 自动翻页后写入 body 的汇总字段
+PAGINATION_RESULT_FIELDS = (ITEM_COUNT, MAX_ITEMS_REACHED) = ('ItemCount', 'MaxItemsReached')
+
+# PageNumber 风格的 API 可以并发拉取的页数
+PAGE_CONCURRENCY = 5
+
+
+def get_pagination_style(parameter_names):
+    """根据 API 参数判断分页方式，不支持分页时返回 None"""
+    parameter_names = set(parameter_names)
+    if MAX_ITEMS_FIELD in parameter_names:
+        return None
+    for style, page_size_parameter in PAGE_SIZE_PARAMETERS.items():
+        if style in parameter_names and page_size_parameter in parameter_names:
+            return style
+    return None
+
+
+def find_items_path(body):
+    """
+    定位响应中的资源列表，如 DescribeInstances 的 ('Instances', 'Instance')，
+    ListXxx 类 API 的列表一般直接位于顶层。
+    """
+    if not isinstance(body, dict):
+        return None
+    for key, value in body.items():
+        if isinstance(value, list):
+            return (key,)
+        if isinstance(value, dict) and len(value) == 1:
+            (sub_key, sub_value), = value.items()
+            if isinstance(sub_value, list):
+                return key, sub_key
+    return None
+
+
+def get_items(body, path):
+    value = body
+    for key in path:
+        if not isinstance(value, dict):
+            return []
+        value = value.get(key)
+    return value if isinstance(value, list) else []
+
+
+def set_items(body, path, items):
+    body = dict(body)
+    if len(path) == 1:
+        body[path[0]] = items
+    else:
+        body[path[0]] = set_items(body.get(path[0]) or {}, path[1:], items)
+    return body
+
+
+async def iter_pages(call, style, parameters, max_items=None):
+    """
+    按页异步产出响应。call 为 async (parameters) -> response 的单次 API 调用。
+    PageNumber 风格且响应带 TotalCount 时，后续页以 PAGE_CONCURRENCY 并发预取、按页序产出，
+    只预取凑够 max_items 所需的页；调用方提前结束迭代时，未完成的预取会被取消。
+    """
+    parameters = dict(parameters)
+    page_size_parameter = PAGE_SIZE_PARAMETERS[style]
+    if not parameters.get(page_size_parameter):
+        parameters[page_size_parameter] = DEFAULT_PAGE_SIZE
+    page_size = int(parameters[page_size_parameter])
+
+    if style == NEXT_TOKEN:
+        while True:
+            response = await call(parameters)
+            yield response
+            next_token = response.get('body', {}).get(NEXT_TOKEN)
+            if not next_token:
+                return
+            parameters[NEXT_TOKEN] = next_token
+
+    page_number = int(parameters.get(PAGE_NUMBER) or 1)
+    response = await call(dict(parameters, **{PAGE_NUMBER: page_number}))
+    yield response
+    body = response.get('body', {})
+    total_count = body.get(TOTAL_COUNT)
+    if total_count is None:
+        path = find_items_path(body)
+        while path is not None and len(get_items(body, path)) >= page_size:
+            page_number += 1
+            response = await call(dict(parameters, **{PAGE_NUMBER: page_number}))
+            yield response
+            body = response.get('body', {})
+        return
+
+    # 以服务端实际生效的分页大小为准
+    page_size = int(body.get(page_size_parameter) or page_size)
+    last_page = math.ceil(int(total_count) / page_size)
+    if max_items is not None:
+        last_page = min(last_page, page_number - 1 + math.ceil(max_items / page_size))
+    next_page = page_number + 1
+    pending = deque()
+    try:
+        while pending or next_page <= last_page:
+            while next_page <= last_page and len(pending) < PAGE_CONCURRENCY:
+                pending.append(asyncio.ensure_future(call(dict(parameters, **{PAGE_NUMBER: next_page}))))
+                next_page += 1
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def collect_items(call, style, parameters, max_items):
+    """自动翻页并最多收集 max_items 条资源，结果保持首页响应的结构"""
+    items = []
+    first_response = None
+    path = None
+    page_size = int(parameters.get(PAGE_SIZE_PARAMETERS[style]) or DEFAULT_PAGE_SIZE)
+    # 起始页之前的资源数，用于与 TotalCount 比较
+    skipped = (int(parameters.get(PAGE_NUMBER) or 1) - 1) * page_size if style == PAGE_NUMBER else 0
+    # 达到 max_items 时是否还有未返回的资源
+    truncated = False
+    pages = iter_pages(call, style, parameters, max_items)
+    try:
+        async for response in pages:
+            body = response.get('body', {})
+            if first_response is None:
+                first_response = response
+                path = find_items_path(body)
+                if path is None:
+                    break
+            page_items = get_items(body, path)
+            remaining = max_items - len(items)
+            items.extend(page_items[:remaining])
+            if len(items) >= max_items:
+                total_count = body.get(TOTAL_COUNT)
+                truncated = (len(page_items) > remaining or bool(body.get(NEXT_TOKEN))
+                             or (total_count is not None and int(total_count) > skipped + len(items))
+                             # 没有 TotalCount 时与 iter_pages 一致，满页即认为还有后续页
+                             or (style == PAGE_NUMBER and total_count is None and len(page_items) >= page_size))
+                break
+    finally:
+        await pages.aclose()
+    if path is None:
+        return first_response
+    body = set_items(first_response.get('body', {}), path, items)
+    body.pop(NEXT_TOKEN, None)
+    body[ITEM_COUNT] = len(items)
+    body[MAX_ITEMS_REACHED] = truncated
+    return dict(first_response, body=body)
@@ -0,0 +1,63 @@
+import re
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.pagination import PAGINATION_RESULT_FIELDS
+
+# 响应字段投影参数，由调用方传入，不会透传给 API
+PROJECTION_FIELD = 'Projection'
+
+# 默认从响应中移除的字段
+DROPPED_RESPONSE_FIELDS = ('headers',)
+
+_WILDCARD = re.compile(r'\[\*?\]')
+
+
+def parse_projection(expression):
+    """
+    将逗号分隔的字段路径解析为字段树，例如
+    'TotalCount, Instances.Instance[*].InstanceId, Instances.Instance[*].Status'
+    路径上遇到列表时自动作用于每个元素，[*] 仅为兼容 JMESPath 写法，可省略。
+    """
+    if isinstance(expression, str):
+        paths = expression.split(',')
+    else:
+        paths = expression or []
+    tree = {}
+    for path in paths:
+        path = _WILDCARD.sub('', path.strip())
+        if not path:
+            continue
+        node = tree
+        keys = [key.strip() for key in path.split('.') if key.strip()]
+        for i, key in enumerate(keys):
+            if i == len(keys) - 1:
+                # 选中整个字段，覆盖更细的子路径
+                node[key] = None
+            elif key in node and node[key] is None:
+                break
+            else:
+                node = node.setdefault(key, {})
+    return tree
+
+
+def project(data, tree):
+    if not tree:
+        return data
+    if isinstance(data, list):
+        return [project(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {key: project(data[key], sub_tree) for key, sub_tree in tree.items() if key in data}
+
+
+def project_response(response, expression=None):
+    """移除 HTTP 头等传输层字段，并按 expression 投影 body；自动翻页的汇总字段总是保留"""
+    if not isinstance(response, dict):
+        return response
+    response = {key: value for key, value in response.items() if key not in DROPPED_RESPONSE_FIELDS}
+    body = response.get('body')
+    if expression and body is not None:
+        projected = project(body, parse_projection(expression))
+        if isinstance(body, dict) and isinstance(projected, dict):
+            projected.update({key: body[key] for key in PAGINATION_RESULT_FIELDS if key in body})
+        response['body'] = projected
+    return response
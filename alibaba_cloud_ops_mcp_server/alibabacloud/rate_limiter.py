@@ -0,0 +1,145 @@
+import time
+import asyncio
+import logging
+import threading
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.exception import is_throttling_error
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    自适应令牌桶：令牌不足时调用方排队等待而不是失败；
+    遇到限流错误时速率减半，之后每隔 recovery_interval 秒无限流则恢复 max_rate 的 recovery_ratio。
+    """
+
+    def __init__(self, rate, burst=None, min_rate=0.5, decrease_factor=0.5, recovery_ratio=0.1,
+                 recovery_interval=1.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst or max(1, rate)
+        self.min_rate = min(min_rate, rate)
+        self.decrease_factor = decrease_factor
+        self.recovery_ratio = recovery_ratio
+        self.recovery_interval = recovery_interval
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._adjusted_at = self._updated_at
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """预占一个令牌，返回需要等待的秒数；令牌可以为负数，表示排队中的请求"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_throttled(self):
+        with self._lock:
+            now = time.monotonic()
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0)
+            self._adjusted_at = now
+        logger.info(f'Throttled, decrease rate to {self.rate:.2f}/s')
+
+    def on_success(self):
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now - self._adjusted_at >= self.recovery_interval:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery_ratio)
+                self._adjusted_at = now
+
+
+class RateLimiter:
+    """
+    按 (service, region, api) 维护令牌桶。
+    quotas 的 key 可以是 'service.api' 或 'service'，取值为每秒请求数，未配置时使用 default_rate；
+    default_rate 为 0 时不限速。
+    """
+
+    def __init__(self, default_rate=50, quotas=None):
+        self.default_rate = default_rate
+        self.quotas = dict(quotas or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, default_rate=None, quotas=None):
+        with self._lock:
+            if default_rate is not None:
+                self.default_rate = default_rate
+            if quotas is not None:
+                self.quotas = dict(quotas)
+            self._buckets.clear()
+
+    def get_rate(self, service: str, api: str):
+        service = service.lower()
+        return self.quotas.get(f'{service}.{api}', self.quotas.get(service, self.default_rate))
+
+    def get_bucket(self, service: str, region_id: str, api: str):
+        key = (service.lower(), (region_id or '').lower(), api)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate = self.get_rate(service, api)
+            if not rate or rate <= 0:
+                return None
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(rate))
+        return bucket
+
+    def acquire(self, service: str, region_id: str, api: str):
+        bucket = self.get_bucket(service, region_id, api)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, service: str, region_id: str, api: str):
+        bucket = self.get_bucket(service, region_id, api)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+    def report(self, service: str, region_id: str, api: str, error=None):
+        bucket = self.get_bucket(service, region_id, api)
+        if bucket is None:
+            return
+        if error is None:
+            bucket.on_success()
+        elif is_throttling_error(error):
+            bucket.on_throttled()
+
+    def call(self, service: str, region_id: str, api: str, func, *args, **kwargs):
+        """限速后调用 func，并根据调用结果调整速率"""
+        self.acquire(service, region_id, api)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.report(service, region_id, api, e)
+            raise
+        self.report(service, region_id, api)
+        return result
+
+    async def call_async(self, service: str, region_id: str, api: str, func, *args, **kwargs):
+        await self.acquire_async(service, region_id, api)
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self.report(service, region_id, api, e)
+            raise
+        self.report(service, region_id, api)
+        return result
+
+
+rate_limiter = RateLimiter()
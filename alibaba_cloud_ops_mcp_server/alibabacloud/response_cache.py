@@ -0,0 +1,95 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+
+# 以这些前缀开头的 API 视为只读（幂等）调用，其余均视为变更操作
+READ_ONLY_API_PREFIXES = ('Describe', 'List', 'Get', 'Query', 'Check')
+
+
+def is_read_only_api(api: str) -> bool:
+    return api.startswith(READ_ONLY_API_PREFIXES)
+
+
+def canonicalize_parameters(parameters: dict) -> str:
+    """忽略取值为 None 的参数和参数顺序，生成稳定的参数表示"""
+    parameters = {key: value for key, value in (parameters or {}).items() if value is not None}
+    return json.dumps(parameters, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def make_request_key(identity: str, service: str, region_id: str, api: str, parameters: dict):
+    return identity, service.lower(), (region_id or '').lower(), api, canonicalize_parameters(parameters)
+
+
+class ResponseCache:
+    """
+    只读 API 的读穿透缓存，按 (凭证身份, service, region, api, 规范化参数) 缓存响应。
+    default_ttl 为 0 且没有为任何 API 单独配置 TTL 时不缓存。
+    变更类 API 调用后，同一 service 和 region 下的缓存全部失效。
+    """
+
+    def __init__(self, max_entries=1024, default_ttl=0, ttls=None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        # api 或 service.api -> ttl
+        self.ttls = dict(ttls or {})
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0 and (self.default_ttl > 0 or any(ttl > 0 for ttl in self.ttls.values()))
+
+    def configure(self, max_entries=None, default_ttl=None, ttls=None):
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if default_ttl is not None:
+                self.default_ttl = default_ttl
+            if ttls is not None:
+                self.ttls = dict(ttls)
+            self._entries.clear()
+
+    def get_ttl(self, service: str, api: str):
+        return self.ttls.get(f'{service.lower()}.{api}', self.ttls.get(api, self.default_ttl))
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, ttl):
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, service: str, region_id: str = None):
+        """region_id 为空时使该 service 下所有地域的缓存失效"""
+        service = service.lower()
+        region_id = region_id.lower() if region_id else None
+        with self._lock:
+            for key in [key for key in self._entries
+                        if key[1] == service and (region_id is None or key[2] == region_id)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+response_cache = ResponseCache()
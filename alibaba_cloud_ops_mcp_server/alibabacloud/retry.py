@@ -0,0 +1,121 @@
+import time
+import random
+import socket
+import asyncio
+import logging
+import threading
+
+import aiohttp
+import requests
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.exception import get_error_code, get_status_code, is_throttling_error
+
+logger = logging.getLogger(__name__)
+
+ERROR_KINDS = (THROTTLING, SERVER_ERROR, CONNECTION, TIMEOUT) = \
+    ('Throttling', 'ServerError', 'Connection', 'Timeout')
+
+# 服务端临时不可用的错误码，HTTP 状态码可能不是 5xx
+SERVER_ERROR_CODES = {'ServiceUnavailable', 'InternalError', 'UnknownError', 'ServiceTimeout'}
+
+TIMEOUT_ERRORS = (TimeoutError, socket.timeout, asyncio.TimeoutError, requests.exceptions.Timeout)
+
+CONNECTION_ERRORS = (ConnectionError, aiohttp.ClientConnectionError, requests.exceptions.ConnectionError)
+
+CLIENT_TOKEN = 'ClientToken'
+
+
+def classify_error(error):
+    """返回可重试错误的类型，不可重试时返回 None"""
+    if is_throttling_error(error):
+        return THROTTLING
+    if isinstance(error, TIMEOUT_ERRORS):
+        return TIMEOUT
+    if isinstance(error, CONNECTION_ERRORS):
+        return CONNECTION
+    status_code = get_status_code(error)
+    if (status_code is not None and status_code >= 500) or get_error_code(error) in SERVER_ERROR_CODES:
+        return SERVER_ERROR
+    # Tea SDK 会把网络异常包装为 UnretryableException
+    inner_exception = getattr(error, 'inner_exception', None)
+    if inner_exception is not None and inner_exception is not error:
+        return classify_error(inner_exception)
+    return None
+
+
+class RetryPolicy:
+    """
+    带抖动的指数退避重试：第 n 次重试前等待 [0, min(max_delay, base_delay * 2^n)) 之间的随机时间，
+    所有重试都必须在 deadline 秒内完成。非幂等调用（变更类 API 且不带 ClientToken）不重试。
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.2, max_delay=5.0, deadline=30.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.stats = {'retries': 0, 'backoff_seconds': 0.0, 'exhausted': 0}
+        self._lock = threading.Lock()
+
+    def configure(self, max_attempts=None, deadline=None):
+        if max_attempts is not None:
+            self.max_attempts = max_attempts
+        if deadline is not None:
+            self.deadline = deadline
+
+    def _next_delay(self, error, attempt, idempotent, started_at):
+        """返回下次重试前的等待时间，不应重试时返回 None"""
+        kind = classify_error(error)
+        if kind is None or not idempotent:
+            return None
+        if attempt + 1 >= self.max_attempts:
+            self._record(exhausted=True)
+            return None
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        retry_after = getattr(error, 'retry_after', None)
+        if isinstance(retry_after, (int, float)) and retry_after > 0:
+            delay = max(delay, retry_after)
+        if time.monotonic() - started_at + delay > self.deadline:
+            self._record(exhausted=True)
+            return None
+        self._record(kind=kind, delay=delay)
+        logger.info(f'Retry after {delay:.2f}s (attempt {attempt + 1}/{self.max_attempts}), {kind}: {error}')
+        return delay
+
+    def _record(self, kind=None, delay=0.0, exhausted=False):
+        with self._lock:
+            if exhausted:
+                self.stats['exhausted'] += 1
+                return
+            self.stats['retries'] += 1
+            self.stats['backoff_seconds'] += delay
+            self.stats[kind] = self.stats.get(kind, 0) + 1
+
+    def call(self, func, *args, idempotent=True, **kwargs):
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, idempotent, started_at)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, func, *args, idempotent=True, **kwargs):
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, idempotent, started_at)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+retry_policy = RetryPolicy()
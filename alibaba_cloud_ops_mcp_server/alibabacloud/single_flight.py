@@ -0,0 +1,36 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    合并相同 key 的并发异步调用：同一时刻只有一个上游请求在执行，其余调用方等待并共享其结果。
+    单个等待方被取消不影响其他等待方；所有等待方都取消后，上游请求也会被取消。
+    """
+
+    def __init__(self):
+        # key -> [task, 等待方数量]
+        self._calls = {}
+
+    async def do(self, key, func):
+        call = self._calls.get(key)
+        if call is None:
+            call = [asyncio.ensure_future(func()), 0]
+            self._calls[key] = call
+            call[0].add_done_callback(lambda _: self._forget(key, call))
+        call[1] += 1
+        try:
+            return await asyncio.shield(call[0])
+        finally:
+            call[1] -= 1
+            if call[1] == 0 and not call[0].done():
+                call[0].cancel()
+
+    def _forget(self, key, call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def __len__(self):
+        return len(self._calls)
+
+
+single_flight = SingleFlight()
@@ -1,8 +1,10 @@
+import asyncio
+import hashlib
 import logging
 
-from alibabacloud_credentials.client import Client as CredClient
 from alibabacloud_tea_openapi.models import Config
 from fastmcp.server.dependencies import get_http_request
+from alibaba_cloud_ops_mcp_server.alibabacloud.credential_cache import get_credentials_client
 
 logger = logging.getLogger(__name__)
 
@@ -28,19 +30,36 @@ def get_credentials_from_header():
     return credentials
 
 
+def get_credential_fingerprint(credentials=None):
+    """凭证指纹，用于区分 HTTP 模式下不同请求头携带的身份；使用默认凭证链时返回 'default'"""
+    if credentials is None:
+        credentials = get_credentials_from_header()
+    if not credentials:
+        return 'default'
+    raw = '\n'.join(credentials.get(key) or '' for key in ('AccessKeyId', 'AccessKeySecret', 'SecurityToken'))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
 def create_config():
     credentials = get_credentials_from_header()
     if credentials:
-        access_key_id = credentials.get('AccessKeyId', None)
-        access_key_secret = credentials.get('AccessKeySecret', None)
-        token = credentials.get('SecurityToken', None)
         config = Config(
-            access_key_id=access_key_id,
-            access_key_secret=access_key_secret,
-            security_token=token
+            access_key_id=credentials.get('AccessKeyId', None),
+            access_key_secret=credentials.get('AccessKeySecret', None),
+            security_token=credentials.get('SecurityToken', None)
         )
     else:
-        credentialsClient = CredClient()
-        config = Config(credential=credentialsClient)
+        config = Config(credential=get_credentials_client())
     config.user_agent = 'alibaba-cloud-ops-mcp-server'
     return config
+
+
+def in_thread(func):
+    """
+    把 SDK 的同步方法包装为在线程中执行的协程函数。
+    同步方法复用 Tea 按 host 维护的 keep-alive 连接池；SDK 的 *_async 方法每次请求都会新建 aiohttp 会话，
+    需要重新建立 TCP/TLS 连接。
+    """
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
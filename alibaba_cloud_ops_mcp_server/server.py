@@ -3,6 +3,15 @@ import click
 import logging
 
 from alibaba_cloud_ops_mcp_server.tools.common_api_tools import set_custom_service_list
+from alibaba_cloud_ops_mcp_server.alibabacloud.api_meta_client import ApiMetaClient
+from alibaba_cloud_ops_mcp_server.alibabacloud.meta_cache import ApiMetaCache, DEFAULT_TTLS
+from alibaba_cloud_ops_mcp_server.alibabacloud.meta_snapshot import MetaSnapshot, build_snapshot
+from alibaba_cloud_ops_mcp_server.alibabacloud.client_pool import client_pool
+from alibaba_cloud_ops_mcp_server.alibabacloud.response_cache import response_cache
+from alibaba_cloud_ops_mcp_server.alibabacloud.rate_limiter import rate_limiter
+from alibaba_cloud_ops_mcp_server.alibabacloud.retry import retry_policy
+from alibaba_cloud_ops_mcp_server.alibabacloud.execution_poller import execution_poller
+from alibaba_cloud_ops_mcp_server.alibabacloud.chunk_scheduler import chunk_scheduler
 from alibaba_cloud_ops_mcp_server.config import config
 from alibaba_cloud_ops_mcp_server.tools import cms_tools, oos_tools, oss_tools, api_tools, common_api_tools
 
@@ -22,7 +31,17 @@ SUPPORTED_SERVICES_MAP = {
 }
 
 
-@click.command()
+def _parse_key_values(values, value_type):
+    result = {}
+    for value in values:
+        key, sep, raw = value.partition('=')
+        if not sep:
+            raise click.BadParameter(f"Expected 'KEY=VALUE', got '{value}'")
+        result[key.strip()] = value_type(raw.strip())
+    return result
+
+
+@click.group(invoke_without_command=True)
 @click.option(
     "--transport",
     type=click.Choice(["stdio", "sse", "streamable-http"]),
@@ -47,7 +66,193 @@ SUPPORTED_SERVICES_MAP = {
     default=None,
     help="Comma-separated list of supported services, e.g., 'ecs,vpc,rds'",
 )
-def main(transport: str, port: int, host: str, services: str):
+@click.option(
+    "--meta-cache-dir",
+    type=str,
+    default=None,
+    help="Directory of the on-disk API meta cache, defaults to ~/.cache/alibaba-cloud-ops-mcp-server",
+)
+@click.option(
+    "--meta-cache-ttl",
+    type=int,
+    default=None,
+    help="TTL in seconds of cached API meta, 0 means always revalidate",
+)
+@click.option(
+    "--no-meta-cache",
+    is_flag=True,
+    default=False,
+    help="Disable the on-disk API meta cache",
+)
+@click.option(
+    "--meta-pool-size",
+    type=int,
+    default=10,
+    help="Max pooled keep-alive connections to the API meta endpoint",
+)
+@click.option(
+    "--meta-connect-timeout",
+    type=float,
+    default=3.05,
+    help="Connect timeout in seconds of API meta requests",
+)
+@click.option(
+    "--meta-read-timeout",
+    type=float,
+    default=10,
+    help="Read timeout in seconds of API meta requests",
+)
+@click.option(
+    "--meta-max-retries",
+    type=int,
+    default=3,
+    help="Max retries with backoff of API meta requests",
+)
+@click.option(
+    "--meta-snapshot",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Serve API meta from an offline snapshot built by the 'snapshot' command",
+)
+@click.option(
+    "--lazy-tools",
+    is_flag=True,
+    default=False,
+    help="Register dynamic API tools from local API meta only and load the rest on first use",
+)
+@click.option(
+    "--client-pool-size",
+    type=int,
+    default=64,
+    help="Max pooled SDK clients, keyed by service, endpoint and credential",
+)
+@click.option(
+    "--client-idle-timeout",
+    type=int,
+    default=300,
+    help="Seconds after which an idle pooled SDK client is evicted",
+)
+@click.option(
+    "--response-cache-ttl",
+    type=int,
+    default=0,
+    help="TTL in seconds of cached Describe/List/Get responses, 0 disables the response cache",
+)
+@click.option(
+    "--response-cache-api-ttl",
+    type=str,
+    multiple=True,
+    help="Per-API response cache TTL, e.g. 'ecs.DescribeRegions=3600' or 'DescribeZones=600', repeatable",
+)
+@click.option(
+    "--response-cache-size",
+    type=int,
+    default=1024,
+    help="Max cached responses, least recently used ones are evicted first",
+)
+@click.option(
+    "--rate-limit",
+    type=float,
+    default=50,
+    help="Default client-side request rate limit per (service, region, api) in requests/second, 0 disables it",
+)
+@click.option(
+    "--rate-limit-quota",
+    type=str,
+    multiple=True,
+    help="Per-service or per-API rate limit, e.g. 'ecs=20' or 'ecs.DescribeInstances=10', repeatable",
+)
+@click.option(
+    "--retry-max-attempts",
+    type=int,
+    default=3,
+    help="Max attempts of retryable cloud API errors (throttling, 5xx, connection reset, timeout)",
+)
+@click.option(
+    "--retry-deadline",
+    type=float,
+    default=30,
+    help="Deadline in seconds of all attempts of one cloud API call",
+)
+@click.option(
+    "--oos-poll-interval",
+    type=float,
+    default=1,
+    help="Initial interval in seconds of polling OOS execution status, grows for long-running executions",
+)
+@click.option(
+    "--oos-max-poll-interval",
+    type=float,
+    default=15,
+    help="Max interval in seconds of polling OOS execution status",
+)
+@click.option(
+    "--oos-chunk-size",
+    type=int,
+    default=100,
+    help="Max targets per OOS bulk execution, larger InstanceIds lists are split into concurrent executions",
+)
+@click.option(
+    "--oos-max-concurrent-executions",
+    type=int,
+    default=10,
+    help="Max OOS bulk executions running at the same time across all tool calls",
+)
+@click.option(
+    "--oos-chunk-rate",
+    type=float,
+    default=2,
+    help="Max OOS bulk executions started per second across all tool calls, 0 disables it",
+)
+@click.option(
+    "--oos-chunk-retries",
+    type=int,
+    default=0,
+    help="Times to retry chunks of an OOS bulk operation whose StartExecution failed, started executions are never rerun",
+)
+@click.option(
+    "--oos-cancel-on-abort",
+    is_flag=True,
+    default=False,
+    help="Cancel the started OOS execution when the client cancels or abandons the tool call",
+)
+@click.option(
+    "--ecs-direct-api-threshold",
+    type=int,
+    default=0,
+    help="Start/stop/reboot up to this many ECS instances by calling ECS APIs directly instead of OOS, "
+         "the returned execution has no ExecutionId and per-instance results in Outputs, 0 (default) disables it",
+)
+@click.pass_context
+def main(ctx: click.Context, transport: str, port: int, host: str, services: str, meta_cache_dir: str,
+         meta_cache_ttl: int, no_meta_cache: bool, meta_pool_size: int, meta_connect_timeout: float,
+         meta_read_timeout: float, meta_max_retries: int, meta_snapshot: str, lazy_tools: bool,
+         client_pool_size: int, client_idle_timeout: int, response_cache_ttl: int,
+         response_cache_api_ttl: tuple, response_cache_size: int, rate_limit: float, rate_limit_quota: tuple,
+         retry_max_attempts: int, retry_deadline: float, oos_poll_interval: float, oos_max_poll_interval: float,
+         oos_chunk_size: int, oos_max_concurrent_executions: int, oos_chunk_rate: float, oos_chunk_retries: int,
+         oos_cancel_on_abort: bool, ecs_direct_api_threshold: int):
+    ttls = {name: meta_cache_ttl for name in DEFAULT_TTLS} if meta_cache_ttl is not None else None
+    ApiMetaClient.set_cache(ApiMetaCache(cache_dir=meta_cache_dir, ttls=ttls, enabled=not no_meta_cache))
+    ApiMetaClient.configure_http(pool_size=meta_pool_size, connect_timeout=meta_connect_timeout,
+                                 read_timeout=meta_read_timeout, max_retries=meta_max_retries)
+    if meta_snapshot:
+        ApiMetaClient.set_snapshot(MetaSnapshot.load(meta_snapshot))
+    client_pool.configure(max_size=client_pool_size, idle_timeout=client_idle_timeout)
+    response_cache.configure(max_entries=response_cache_size, default_ttl=response_cache_ttl,
+                             ttls=_parse_key_values(response_cache_api_ttl, int))
+    rate_limiter.configure(default_rate=rate_limit, quotas=_parse_key_values(rate_limit_quota, float))
+    retry_policy.configure(max_attempts=retry_max_attempts, deadline=retry_deadline)
+    execution_poller.configure(initial_interval=oos_poll_interval, max_interval=oos_max_poll_interval)
+    chunk_scheduler.configure(chunk_size=oos_chunk_size, max_concurrency=oos_max_concurrent_executions,
+                              rate=oos_chunk_rate, max_retries=oos_chunk_retries)
+    oos_tools.set_cancel_execution_on_abort(oos_cancel_on_abort)
+    oos_tools.set_direct_api_threshold(ecs_direct_api_threshold)
+
+    ctx.obj = {'services': services}
+    if ctx.invoked_subcommand is not None:
+        return
+
     # Create an MCP server
     mcp = FastMCP(
         name="alibaba-cloud-ops-mcp-server",
@@ -67,12 +272,46 @@ def main(transport: str, port: int, host: str, services: str):
         mcp.tool(tool)
     for tool in oss_tools.tools:
         mcp.tool(tool)
-    api_tools.create_api_tools(mcp, config)
+    api_tools.create_api_tools(mcp, config, lazy=lazy_tools)
 
     # Initialize and run the server
     logger.debug(f'mcp server is running on {transport} mode.')
     mcp.run(transport=transport)
 
 
+@main.command()
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    required=True,
+    help="Path of the snapshot file to write, e.g. 'api-meta.json.gz'",
+)
+@click.option(
+    "--configured-apis-only",
+    is_flag=True,
+    default=False,
+    help="Only crawl the APIs in config.py instead of every API of the configured services",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=8,
+    help="Number of concurrent API meta downloads",
+)
+@click.pass_context
+def snapshot(ctx: click.Context, output: str, configured_apis_only: bool, workers: int):
+    """Crawl API meta of the configured services into an offline snapshot file."""
+    service_keys = list(config.keys()) + ['oos']
+    services = ctx.obj.get('services')
+    if services:
+        service_keys.extend(s.strip().lower() for s in services.split(","))
+    service_keys = list(dict.fromkeys(key.lower() for key in service_keys))
+    apis = config if configured_apis_only else None
+    meta_snapshot = build_snapshot(service_keys, apis=apis, max_workers=workers)
+    meta_snapshot.dump(output)
+    click.echo(f'Wrote {len(meta_snapshot.documents)} API meta documents to {output}')
+
+
 if __name__ == "__main__":
     main()
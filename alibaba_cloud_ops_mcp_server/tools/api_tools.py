@@ -1,18 +1,35 @@
 import os
+import asyncio
 from mcp.server.fastmcp import FastMCP, Context
 from pydantic import Field
+from fastmcp.tools import Tool
+from fastmcp.server.dependencies import get_context
 import logging
 import json
 
 import inspect
+import time
 import types
-from dataclasses import make_dataclass, field
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import make_dataclass, field, dataclass
 from alibabacloud_tea_openapi import models as open_api_models
 from alibabacloud_tea_util import models as util_models
 from alibabacloud_tea_openapi.client import Client as OpenApiClient
 from alibabacloud_openapi_util.client import Client as OpenApiUtilClient
 from alibaba_cloud_ops_mcp_server.alibabacloud.api_meta_client import ApiMetaClient
-from alibaba_cloud_ops_mcp_server.alibabacloud.utils import create_config
+from alibaba_cloud_ops_mcp_server.alibabacloud.utils import create_config, get_credential_fingerprint, in_thread
+from alibaba_cloud_ops_mcp_server.alibabacloud.client_pool import client_pool
+from alibaba_cloud_ops_mcp_server.alibabacloud.pagination import MAX_ITEMS_FIELD, collect_items, get_pagination_style
+from alibaba_cloud_ops_mcp_server.alibabacloud.projection import PROJECTION_FIELD, project_response
+from alibaba_cloud_ops_mcp_server.alibabacloud.response_cache import response_cache, is_read_only_api, make_request_key
+from alibaba_cloud_ops_mcp_server.alibabacloud.single_flight import single_flight
+from alibaba_cloud_ops_mcp_server.alibabacloud.rate_limiter import rate_limiter
+from alibaba_cloud_ops_mcp_server.alibabacloud.retry import retry_policy, CLIENT_TOKEN
+from alibaba_cloud_ops_mcp_server.alibabacloud import exception
+
+logger = logging.getLogger(__name__)
 
 
 type_map = {
@@ -36,6 +53,30 @@ DOUBLE_ENDPOINT_SERVICE = {
 
 CENTRAL_ENDPOINTS_SERVICE = ['cbn']
 
+DEFAULT_REGION_ID = 'cn-hangzhou'
+
+# RegionId 取值为 '*' 时扇出到所有地域
+ALL_REGIONS = '*'
+
+# 多地域扇出调用的最大并发数
+FAN_OUT_CONCURRENCY = 10
+
+# DescribeRegions 结果的缓存时间（秒）
+REGION_IDS_TTL = 3600
+
+_REGION_IDS = {}
+
+# 只读 API 的 RegionId 支持扇出到多个地域；变更类 API 只接受单个地域
+REGION_ID_DESCRIPTION = '地域ID，取值为 * 时查询所有地域，多个地域以逗号分隔'
+SINGLE_REGION_ID_DESCRIPTION = '地域ID'
+
+# 懒加载模式下，本地没有 API META 的工具通过该参数透传 API 参数
+LAZY_PARAMETERS_FIELD = 'Parameters'
+
+# 以最小参数定义注册、等待替换为完整参数定义的工具 (service, api) -> 已注册的 Tool
+_LAZY_TOOLS = {}
+_LAZY_TOOLS_LOCK = threading.Lock()
+
 
 def _get_service_endpoint(service: str, region_id: str):
     region_id = region_id.lower()
@@ -52,11 +93,16 @@ def _get_service_endpoint(service: str, region_id: str):
 
 
 def create_client(service: str, region_id: str) -> OpenApiClient:
-    config = create_config()
     if isinstance(service, str):
         service = service.lower()
-    config.endpoint = _get_service_endpoint(service, region_id.lower())
-    return OpenApiClient(config)
+    endpoint = _get_service_endpoint(service, region_id.lower())
+
+    def factory():
+        config = create_config()
+        config.endpoint = endpoint
+        return OpenApiClient(config)
+
+    return client_pool.get(('OpenApiClient', service, endpoint, get_credential_fingerprint()), factory)
 
 
 # 类型为String的JSON数组参数
@@ -68,44 +114,243 @@ ECS_LIST_PARAMETERS = {
 }
 
 
-def _tools_api_call(service: str, api: str, parameters: dict, ctx: Context):
-    service = service.lower()
-    api_meta, _ = ApiMetaClient.get_api_meta(service, api)
-    version = ApiMetaClient.get_service_version(service)
-    method = 'POST' if api_meta.get('methods', [])[0] == 'post' else 'GET'
-    path = api_meta.get('path', '/')
-    style = ApiMetaClient.get_service_style(service)
-    
-    # 处理特殊参数格式
-    processed_parameters = parameters.copy()
-    if service == 'ecs':
+@dataclass(frozen=True)
+class CallPlan:
+    """一个 (service, api) 调用所需的全部元数据，构建一次后复用"""
+    action: str
+    version: str
+    pathname: str
+    method: str
+    style: str
+    # 需要以 JSON 数组字符串传递的参数
+    json_list_params: frozenset = frozenset()
+    # 分页方式：PageNumber、NextToken，不支持分页时为 None
+    pagination: str = None
+    # API 自身定义的参数名
+    parameter_names: frozenset = frozenset()
+
+    def encode_parameters(self, parameters: dict) -> dict:
+        processed_parameters = parameters.copy()
         for param_name, param_value in parameters.items():
-            if param_name in ECS_LIST_PARAMETERS and isinstance(param_value, list):
+            if param_name in self.json_list_params and isinstance(param_value, list):
                 processed_parameters[param_name] = json.dumps(param_value)
-    
+        return processed_parameters
+
+    def to_params(self) -> open_api_models.Params:
+        return open_api_models.Params(
+            action=self.action,
+            version=self.version,
+            protocol='HTTPS',
+            pathname=self.pathname,
+            method=self.method,
+            auth_type='AK',
+            style=self.style,
+            req_body_type='formData',
+            body_type='json'
+        )
+
+
+_CALL_PLANS = {}
+_CALL_PLANS_LOCK = threading.Lock()
+
+
+def _build_call_plan(service: str, api: str, api_meta: dict = None) -> CallPlan:
+    if api_meta is None:
+        api_meta, version = ApiMetaClient.get_api_meta(service, api)
+    else:
+        version = ApiMetaClient.get_service_version(service)
+    _, api_standard = ApiMetaClient.get_standard_service_and_api(service, api, version)
+    methods = api_meta.get('methods') or ['get']
+    parameter_names = frozenset(parameter.get('name') for parameter in api_meta.get('parameters', []))
+    return CallPlan(
+        action=api_standard or api,
+        version=version,
+        pathname=api_meta.get('path', '/'),
+        method='POST' if methods[0] == 'post' else 'GET',
+        style=ApiMetaClient.get_service_style(service),
+        json_list_params=frozenset(ECS_LIST_PARAMETERS) if service == 'ecs' else frozenset(),
+        pagination=get_pagination_style(parameter_names),
+        parameter_names=parameter_names
+    )
+
+
+def get_call_plan(service: str, api: str, api_meta: dict = None) -> CallPlan:
+    service = service.lower()
+    key = (service, api.lower())
+    plan = _CALL_PLANS.get(key)
+    if plan is None:
+        plan = _build_call_plan(service, api, api_meta)
+        with _CALL_PLANS_LOCK:
+            plan = _CALL_PLANS.setdefault(key, plan)
+    return plan
+
+
+async def get_call_plan_async(service: str, api: str) -> CallPlan:
+    plan = _CALL_PLANS.get((service.lower(), api.lower()))
+    if plan is None:
+        # 冷启动时拉取 API META 是阻塞操作，放到线程中执行，避免阻塞事件循环
+        plan = await asyncio.to_thread(get_call_plan, service, api)
+    return plan
+
+
+def _prepare_api_call(service: str, plan: CallPlan, parameters: dict):
+    processed_parameters = plan.encode_parameters(parameters)
     req = open_api_models.OpenApiRequest(
         query=OpenApiUtilClient.query(processed_parameters)
     )
-    params = open_api_models.Params(
-        action=api,
-        version=version,
-        protocol='HTTPS',
-        pathname=path,
-        method=method,
-        auth_type='AK',
-        style=style,
-        req_body_type='formData',
-        body_type='json'
-    )
     client = create_client(service, processed_parameters.get('RegionId', 'cn-hangzhou'))
     runtime = util_models.RuntimeOptions()
-    return client.call_api(params, req, runtime)
+    return client, plan.to_params(), req, runtime
+
+
+def _with_client_token(plan: CallPlan, parameters: dict) -> dict:
+    """支持 ClientToken 的变更类 API 自动生成 ClientToken，使其可以安全重试"""
+    if CLIENT_TOKEN in plan.parameter_names and not parameters.get(CLIENT_TOKEN):
+        parameters = dict(parameters, **{CLIENT_TOKEN: str(uuid.uuid4())})
+    return parameters
+
+
+async def _call_api_async(service: str, api: str, parameters: dict, ctx: Context):
+    service = service.lower()
+    plan = await get_call_plan_async(service, api)
+    region_id = parameters.get('RegionId') or DEFAULT_REGION_ID
+    if not is_read_only_api(plan.action):
+        parameters = _with_client_token(plan, parameters)
+        client, params, req, runtime = _prepare_api_call(service, plan, parameters)
+        try:
+            return await retry_policy.call_async(rate_limiter.call_async, service, region_id, plan.action,
+                                                 in_thread(client.call_api), params, req, runtime,
+                                                 idempotent=bool(parameters.get(CLIENT_TOKEN)))
+        finally:
+            response_cache.invalidate(service, region_id)
+
+    request_key = make_request_key(get_credential_fingerprint(), service, region_id, plan.action, parameters)
+    if response_cache.enabled:
+        response = response_cache.get(request_key)
+        if response is not None:
+            return response
+    client, params, req, runtime = _prepare_api_call(service, plan, parameters)
+    # 相同的只读请求并发时只发起一次上游调用
+    response = await single_flight.do(request_key, lambda: retry_policy.call_async(
+        rate_limiter.call_async, service, region_id, plan.action, in_thread(client.call_api), params, req, runtime))
+    if response_cache.enabled:
+        response_cache.put(request_key, response, response_cache.get_ttl(service, plan.action))
+    return response
+
+
+def _parse_region_ids(region_id):
+    """RegionId 为 '*'、逗号分隔的字符串或列表时返回需要扇出的地域列表，否则返回 None"""
+    if isinstance(region_id, (list, tuple)):
+        return [r.strip() for r in region_id if r and r.strip()]
+    if not isinstance(region_id, str):
+        return None
+    if region_id.strip() == ALL_REGIONS:
+        return ALL_REGIONS
+    if ',' in region_id:
+        return [r.strip() for r in region_id.split(',') if r.strip()]
+    return None
+
+
+def _extract_region_ids(data):
+    region_ids = []
+
+    def walk(value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if key == 'RegionId' and isinstance(item, str):
+                    region_ids.append(item)
+                else:
+                    walk(item)
+        elif isinstance(value, list):
+            for item in value:
+                walk(item)
+
+    walk(data)
+    return list(dict.fromkeys(region_ids))
+
+
+async def get_region_ids(service: str, ctx: Context = None) -> list:
+    """通过 DescribeRegions 获取地域列表，按 (service, 凭证指纹) 缓存"""
+    service = service.lower()
+    key = (service, get_credential_fingerprint())
+    cached = _REGION_IDS.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    try:
+        response = await _call_api_async(service, 'DescribeRegions', {'RegionId': DEFAULT_REGION_ID}, ctx)
+    except Exception as e:
+        if service == 'ecs':
+            raise
+        logger.info(f'Failed to describe regions of {service}, fall back to ecs, error: {e}')
+        return await get_region_ids('ecs', ctx)
+    region_ids = _extract_region_ids(response.get('body', {}))
+    _REGION_IDS[key] = (time.monotonic() + REGION_IDS_TTL, region_ids)
+    return region_ids
+
+
+async def _call_region_async(service: str, api: str, parameters: dict, plan: CallPlan, max_items: int,
+                             ctx: Context):
+    if not max_items or plan.pagination is None:
+        return await _call_api_async(service, api, parameters, ctx)
+
+    async def call(page_parameters):
+        return await _call_api_async(service, api, page_parameters, ctx)
+
+    return await collect_items(call, plan.pagination, parameters, max_items)
+
+
+async def _fan_out_api_call_async(service: str, api: str, parameters: dict, region_ids: list, plan: CallPlan,
+                                  max_items: int, ctx: Context):
+    semaphore = asyncio.Semaphore(FAN_OUT_CONCURRENCY)
+
+    async def call(region_id):
+        async with semaphore:
+            return await _call_region_async(service, api, dict(parameters, RegionId=region_id), plan, max_items,
+                                            ctx)
+
+    responses = await asyncio.gather(*[call(region_id) for region_id in region_ids], return_exceptions=True)
+    results = {}
+    errors = {}
+    for region_id, response in zip(region_ids, responses):
+        if isinstance(response, Exception):
+            errors[region_id] = str(response)
+        else:
+            results[region_id] = response
+    return {'RegionIds': region_ids, 'Results': results, 'Errors': errors}
+
+
+async def _tools_api_call_async(service: str, api: str, parameters: dict, ctx: Context):
+    plan = await get_call_plan_async(service, api)
+    parameters = dict(parameters)
+    max_items = None
+    if MAX_ITEMS_FIELD not in plan.parameter_names:
+        max_items = parameters.pop(MAX_ITEMS_FIELD, None)
+    projection = None
+    if PROJECTION_FIELD not in plan.parameter_names:
+        projection = parameters.pop(PROJECTION_FIELD, None)
+    region_ids = _parse_region_ids(parameters.get('RegionId'))
+    if region_ids is not None and not is_read_only_api(plan.action):
+        # 变更类 API 不扇出，避免同一个写操作在多个地域重复执行
+        raise exception.MultiRegionNotSupported(api=plan.action, region_id=parameters.get('RegionId'))
+    if region_ids is None:
+        response = await _call_region_async(service, api, parameters, plan, max_items, ctx)
+        return project_response(response, projection)
+    if region_ids == ALL_REGIONS:
+        region_ids = await get_region_ids(service, ctx)
+    result = await _fan_out_api_call_async(service, api, parameters, region_ids, plan, max_items, ctx)
+    result['Results'] = {region_id: project_response(response, projection)
+                         for region_id, response in result['Results'].items()}
+    return result
 
 
 def _create_parameter_schema(fields: dict):
     return make_dataclass("ParameterSchema", [(name, type_, value) for name, (type_, value) in fields.items()])
 
 
+def _get_region_id_description(api):
+    return REGION_ID_DESCRIPTION if is_read_only_api(api) else SINGLE_REGION_ID_DESCRIPTION
+
+
 def _create_function_schemas(service, api, api_meta):
     schemas = {}
     schemas[api] = {}
@@ -158,20 +403,63 @@ def _create_function_schemas(service, api, api_meta):
         name, field_info = process_parameter(parameter)
         schemas[api][name] = field_info
 
+    if get_pagination_style(schemas[api].keys()) is not None:
+        schemas[api][MAX_ITEMS_FIELD] = (
+            int,
+            field(
+                default=None,
+                metadata={'description': '自动翻页并最多返回的资源条数，为空时只返回单页结果', 'required': False}
+            )
+        )
+
+    if PROJECTION_FIELD not in schemas[api]:
+        schemas[api][PROJECTION_FIELD] = (
+            str,
+            field(
+                default=None,
+                metadata={'description': '只返回指定的响应字段，多个字段路径以逗号分隔，'
+                                         '如 TotalCount,Instances.Instance[*].InstanceId', 'required': False}
+            )
+        )
+
     if 'RegionId' not in schemas[api]:
         schemas[api]['RegionId'] = (
             str,
             field(
                 default='cn-hangzhou',
-                metadata={'description': '地域ID', 'required': False}
+                metadata={'description': _get_region_id_description(api), 'required': False}
             )
         )
     return schemas
 
 
-def _create_tool_function_with_signature(service: str, api: str, fields: dict, description: str):
+def _create_lazy_function_schemas(service, api):
+    """本地没有 API META 时使用的最小参数定义"""
+    return {
+        'RegionId': (
+            str,
+            field(
+                default='cn-hangzhou',
+                metadata={'description': _get_region_id_description(api), 'required': False}
+            )
+        ),
+        LAZY_PARAMETERS_FIELD: (
+            dict,
+            field(
+                default=None,
+                metadata={'description': f'{service}.{api} 的其他参数，参数定义可通过 GetAPIInfo 获取',
+                          'required': False}
+            )
+        )
+    }
+
+
+def _create_tool_function_with_signature(service: str, api: str, fields: dict, description: str,
+                                         lazy: bool = False, on_first_call=None):
     """
     Dynamically creates a lambda function with a custom signature based on the provided fields.
+    lazy: 接受 LAZY_PARAMETERS_FIELD，调用时将其展开为 API 参数；必填参数也可以通过它传入，因此签名中不再必填
+    on_first_call: 首次调用成功后执行的异步回调
     """
     parameters = []
     annotations = {}
@@ -179,7 +467,7 @@ def _create_tool_function_with_signature(service: str, api: str, fields: dict, d
 
     for name, (type_, field_info) in fields.items():
         field_description = field_info.metadata.get('description', '')
-        is_required = field_info.metadata.get('required', False)
+        is_required = field_info.metadata.get('required', False) and not lazy
         default_value = field_info.default if not is_required else ...
 
         field_default = Field(default=default_value, description=field_description)
@@ -194,16 +482,26 @@ def _create_tool_function_with_signature(service: str, api: str, fields: dict, d
 
     signature = inspect.Signature(parameters)
     function_name = f'{service.upper()}_{api}'
-    def func_code(*args, **kwargs):
+    async def func_code(*args, **kwargs):
         bound_args = signature.bind(*args, **kwargs)
         bound_args.apply_defaults()
-
-        return _tools_api_call(
+        arguments = dict(bound_args.arguments)
+        if lazy:
+            lazy_parameters = arguments.pop(LAZY_PARAMETERS_FIELD, None) or {}
+            for name, value in lazy_parameters.items():
+                # Parameters 中的参数优先于取默认值的同名参数
+                if name not in arguments or arguments[name] == signature.parameters[name].default.default:
+                    arguments[name] = value
+
+        response = await _tools_api_call_async(
             service=service,
             api=api,
-            parameters=bound_args.arguments,
+            parameters=arguments,
             ctx=None
         )
+        if on_first_call is not None:
+            await on_first_call()
+        return response
 
     func = types.FunctionType(
         func_code.__code__,
@@ -220,18 +518,117 @@ def _create_tool_function_with_signature(service: str, api: str, fields: dict, d
     return func
 
 
-def _create_and_decorate_tool(mcp: FastMCP, service: str, api: str):
+def _create_tool_function(service: str, api: str, api_meta: dict = None, on_first_call=None,
+                          with_lazy_parameters: bool = False):
+    """with_lazy_parameters: 完整参数定义的工具仍接受 LAZY_PARAMETERS_FIELD，兼容按最小参数定义调用的客户端"""
+    if api_meta is not None:
+        fields = _create_function_schemas(service, api, api_meta).get(api, {})
+        if with_lazy_parameters:
+            fields[LAZY_PARAMETERS_FIELD] = _create_lazy_function_schemas(service, api)[LAZY_PARAMETERS_FIELD]
+        description = api_meta.get('summary', '')
+        return _create_tool_function_with_signature(service, api, fields, description, lazy=with_lazy_parameters)
+    fields = _create_lazy_function_schemas(service, api)
+    description = f'调用阿里云 {service} 的 {api} 接口'
+    return _create_tool_function_with_signature(service, api, fields, description, lazy=True,
+                                                on_first_call=on_first_call)
+
+
+def _create_and_decorate_tool(mcp: FastMCP, service: str, api: str, api_meta: dict = None, lazy: bool = False):
     """Create a tool function for an AlibabaCloud openapi."""
-    api_meta, _ = ApiMetaClient.get_api_meta(service, api)
-    fields = _create_function_schemas(service, api, api_meta).get(api, {})
-    description = api_meta.get('summary', '')
-    dynamic_lambda = _create_tool_function_with_signature(service, api, fields, description)
+    if api_meta is None and not lazy:
+        api_meta, _ = ApiMetaClient.get_api_meta(service, api)
+    if api_meta is not None and not lazy:
+        get_call_plan(service, api, api_meta)
+    on_first_call = None
+    if api_meta is None:
+        async def on_first_call():
+            await _materialize_lazy_tool_async(service, api)
+    dynamic_lambda = _create_tool_function(service, api, api_meta, on_first_call)
     function_name = f'{service.upper()}_{api}'
     decorated_function = mcp.tool(name=function_name)(dynamic_lambda)
+    if api_meta is None:
+        with _LAZY_TOOLS_LOCK:
+            _LAZY_TOOLS[(service, api)] = decorated_function
 
     return decorated_function
 
-def create_api_tools(mcp: FastMCP, config:dict):
-    for service_code, apis in config.items():
-        for api_name in apis:
-            _create_and_decorate_tool(mcp, service_code, api_name)
+
+def _load_full_tool(service: str, api: str):
+    """加载 API META 与调用计划，返回完整参数定义的 Tool；工具已替换或加载失败时返回 None"""
+    with _LAZY_TOOLS_LOCK:
+        if (service, api) not in _LAZY_TOOLS:
+            return None
+    function_name = f'{service.upper()}_{api}'
+    try:
+        api_meta, _ = ApiMetaClient.get_api_meta(service, api)
+        get_call_plan(service, api, api_meta)
+        tool = Tool.from_function(_create_tool_function(service, api, api_meta, with_lazy_parameters=True),
+                                  name=function_name)
+        # 对外声明的参数定义保留必填参数
+        parameters = Tool.from_function(_create_tool_function(service, api, api_meta), name=function_name).parameters
+        parameters['properties'][LAZY_PARAMETERS_FIELD] = tool.parameters['properties'][LAZY_PARAMETERS_FIELD]
+        return tool.model_copy(update={'parameters': parameters})
+    except Exception as e:
+        logger.warning(f'Failed to materialize tool {function_name}, error: {e}')
+        return None
+
+
+def _replace_lazy_tool(service: str, api: str, full_tool) -> bool:
+    """
+    原地把已注册工具的实现与参数定义替换为完整定义，工具不会被移除或改变注册顺序。
+    完整定义的函数同样接受最小定义的参数，因此先替换函数再替换参数定义，任意时刻的调用都能通过校验。
+    """
+    with _LAZY_TOOLS_LOCK:
+        tool = _LAZY_TOOLS.pop((service, api), None)
+        if tool is None:
+            return False
+        tool.fn = full_tool.fn
+        tool.parameters = full_tool.parameters
+        tool.description = full_tool.description
+    return True
+
+
+def _materialize_lazy_tool(service: str, api: str) -> bool:
+    full_tool = _load_full_tool(service, api)
+    return full_tool is not None and _replace_lazy_tool(service, api, full_tool)
+
+
+async def _materialize_lazy_tool_async(service: str, api: str):
+    """首次调用后在事件循环中替换工具，并通知当前会话的客户端重新获取工具列表"""
+    full_tool = await asyncio.to_thread(_load_full_tool, service, api)
+    if full_tool is None or not _replace_lazy_tool(service, api, full_tool):
+        return
+    try:
+        await get_context().session.send_tool_list_changed()
+    except Exception as e:
+        logger.info(f'Failed to send tool list changed notification: {e}')
+
+
+def _warm_up_call_plans(targets, max_workers):
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+        for (service_code, api_name), future in zip(targets, [executor.submit(get_call_plan, *target)
+                                                              for target in targets]):
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f'Failed to warm up call plan, service: {service_code}, api: {api_name}, error: {e}')
+                continue
+            _materialize_lazy_tool(service_code, api_name)
+
+
+def create_api_tools(mcp: FastMCP, config: dict, max_workers: int = 16, lazy: bool = False):
+    targets = [(service_code, api_name) for service_code, apis in config.items() for api_name in apis]
+    if not targets:
+        return
+    if lazy:
+        # 懒加载：只使用本地 API META 注册工具，不发起网络请求；完整 META 与调用计划在后台或首次调用时加载
+        for service_code, api_name in targets:
+            api_meta = ApiMetaClient.get_local_api_meta(service_code, api_name)
+            _create_and_decorate_tool(mcp, service_code, api_name, api_meta, lazy=True)
+        threading.Thread(target=_warm_up_call_plans, args=(targets, max_workers), daemon=True).start()
+        return
+    # 并发拉取 API META，按配置顺序注册工具，保证注册顺序确定
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+        api_metas = executor.map(lambda target: ApiMetaClient.get_api_meta(*target)[0], targets)
+        for (service_code, api_name), api_meta in zip(targets, api_metas):
+            _create_and_decorate_tool(mcp, service_code, api_name, api_meta)
@@ -5,7 +5,10 @@ import json
 
 from alibabacloud_cms20190101.client import Client as cms20190101Client
 from alibabacloud_cms20190101 import models as cms_20190101_models
-from alibaba_cloud_ops_mcp_server.alibabacloud.utils import create_config
+from alibaba_cloud_ops_mcp_server.alibabacloud.utils import create_config, get_credential_fingerprint, in_thread
+from alibaba_cloud_ops_mcp_server.alibabacloud.client_pool import client_pool
+from alibaba_cloud_ops_mcp_server.alibabacloud.rate_limiter import rate_limiter
+from alibaba_cloud_ops_mcp_server.alibabacloud.retry import retry_policy
 
 
 END_STATUSES = ['Success', 'Failed', 'Cancelled']
@@ -15,12 +18,17 @@ tools = []
 
 
 def create_client(region_id: str) -> cms20190101Client:
-    config = create_config()
-    config.endpoint = f'metrics.{region_id}.aliyuncs.com'
-    return cms20190101Client(config)
+    endpoint = f'metrics.{region_id}.aliyuncs.com'
 
+    def factory():
+        config = create_config()
+        config.endpoint = endpoint
+        return cms20190101Client(config)
 
-def _get_cms_metric_data(region_id: str, instance_ids: List[str], metric_name: str):
+    return client_pool.get(('cms20190101Client', 'cms', endpoint, get_credential_fingerprint()), factory)
+
+
+async def _get_cms_metric_data(region_id: str, instance_ids: List[str], metric_name: str):
     client = create_client(region_id)
     dimesion = []
     for instance_id in instance_ids:
@@ -32,84 +40,88 @@ def _get_cms_metric_data(region_id: str, instance_ids: List[str], metric_name: s
         metric_name=metric_name,
         dimensions=json.dumps(dimesion),
     )
-    describe_metric_last_resp = client.describe_metric_last(describe_metric_last_request)
+    # 重试退避和限速等待不能阻塞事件循环
+    describe_metric_last_resp = await retry_policy.call_async(rate_limiter.call_async, 'cms', region_id,
+                                                              'DescribeMetricLast',
+                                                              in_thread(client.describe_metric_last),
+                                                              describe_metric_last_request)
     return describe_metric_last_resp.body.datapoints
 
 @tools.append
-def CMS_GetCpuUsageData(
+async def CMS_GetCpuUsageData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取ECS实例的CPU使用率数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'cpu_total')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'cpu_total')
 
 
 @tools.append
-def CMS_GetCpuLoadavgData(
+async def CMS_GetCpuLoadavgData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取CPU一分钟平均负载指标数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'load_1m')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'load_1m')
 
 
 @tools.append
-def CMS_GetCpuloadavg5mData(
+async def CMS_GetCpuloadavg5mData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取CPU五分钟平均负载指标数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'load_5m')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'load_5m')
     
 
 @tools.append
-def CMS_GetCpuloadavg15mData(
+async def CMS_GetCpuloadavg15mData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取CPU十五分钟平均负载指标数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'load_15m')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'load_15m')
 
 @tools.append
-def CMS_GetMemUsedData(
+async def CMS_GetMemUsedData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取内存使用量指标数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'memory_usedspace')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'memory_usedspace')
 
 
 @tools.append
-def CMS_GetMemUsageData(
+async def CMS_GetMemUsageData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取内存利用率指标数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'memory_usedutilization')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'memory_usedutilization')
 
 
 @tools.append
-def CMS_GetDiskUsageData(
+async def CMS_GetDiskUsageData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取磁盘利用率指标数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'diskusage_utilization')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'diskusage_utilization')
 
 
 @tools.append
-def CMS_GetDiskTotalData(
+async def CMS_GetDiskTotalData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取磁盘分区总容量指标数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'diskusage_total')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'diskusage_total')
 
 
 @tools.append
-def CMS_GetDiskUsedData(
+async def CMS_GetDiskUsedData(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
 ):
     """获取磁盘分区使用量指标数据"""
-    return _get_cms_metric_data(RegionId, InstanceIds, 'diskusage_used')
+    return await _get_cms_metric_data(RegionId, InstanceIds, 'diskusage_used')
@@ -7,7 +7,8 @@ from alibabacloud_tea_openapi.client import Client as OpenApiClient
 from alibabacloud_openapi_util.client import Client as OpenApiUtilClient
 from alibaba_cloud_ops_mcp_server.alibabacloud.api_meta_client import ApiMetaClient
 from alibaba_cloud_ops_mcp_server.alibabacloud.static import PROMPT_UNDERSTANDING
-from alibaba_cloud_ops_mcp_server.tools.api_tools import create_client, _tools_api_call
+from alibaba_cloud_ops_mcp_server.alibabacloud.projection import PROJECTION_FIELD
+from alibaba_cloud_ops_mcp_server.tools.api_tools import create_client, _tools_api_call_async
 
 END_STATUSES = ['Success', 'Failed', 'Cancelled']
 
@@ -63,12 +64,16 @@ def GetAPIInfo(
 
 
 @tools.append
-def CommonAPICaller(
+async def CommonAPICaller(
         service: str = Field(description='AlibabaCloud service code'),
         api: str = Field(description='AlibabaCloud api name'),
         parameters: dict = Field(description='AlibabaCloud ECS instance ID List', default={}),
+        projection: str = Field(description='Comma-separated response field paths to keep, '
+                                            'e.g. TotalCount,Instances.Instance[*].InstanceId', default=None),
 ):
     """
     Use PromptUnderstanding tool first to understand the user's query, Perform the actual call by specifying the Service, API, and Parameters
     """
-    return _tools_api_call(service, api, parameters, None)
+    if projection:
+        parameters = dict(parameters, **{PROJECTION_FIELD: projection})
+    return await _tools_api_call_async(service, api, parameters, None)
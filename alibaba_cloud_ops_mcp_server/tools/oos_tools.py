@@ -1,56 +1,603 @@
 from pydantic import Field
 from typing import List
 import os
+import copy
 import json
 import time
+import asyncio
+import logging
+import uuid
 
+from fastmcp import Context
 from alibabacloud_oos20190601.client import Client as oos20190601Client
 from alibabacloud_oos20190601 import models as oos_20190601_models
-from alibaba_cloud_ops_mcp_server.alibabacloud.utils import create_config
+from alibabacloud_ecs20140526.client import Client as ecs20140526Client
+from alibabacloud_ecs20140526 import models as ecs_20140526_models
+from alibaba_cloud_ops_mcp_server.alibabacloud.utils import create_config, get_credential_fingerprint, in_thread
+from alibaba_cloud_ops_mcp_server.alibabacloud.client_pool import client_pool
+from alibaba_cloud_ops_mcp_server.alibabacloud.response_cache import response_cache
+from alibaba_cloud_ops_mcp_server.alibabacloud.rate_limiter import rate_limiter
+from alibaba_cloud_ops_mcp_server.alibabacloud.retry import retry_policy
+from alibaba_cloud_ops_mcp_server.alibabacloud.execution_poller import execution_poller
+from alibaba_cloud_ops_mcp_server.alibabacloud.chunk_scheduler import chunk_scheduler
 from alibaba_cloud_ops_mcp_server.alibabacloud import exception
 
 
+logger = logging.getLogger(__name__)
+
 END_STATUSES = [SUCCESS, FAILED, CANCELLED] = ['Success', 'Failed', 'Cancelled']
 
+# 分片执行已启动但未能查询到最终状态
+UNKNOWN = 'Unknown'
+
+# 客户端请求了进度通知时，等待执行结束期间推送进度的间隔（秒）
+PROGRESS_INTERVAL = 5
+
+# 收集命令输出时同时查询的子执行数量
+OUTPUT_CONCURRENCY = 10
+
+# 命令输出在子执行或任务执行 Outputs 中的字段名
+INVOCATION_OUTPUT_KEYS = ('invocationOutput', 'InvocationOutput', 'output', 'Output')
+INVOKE_ID_KEYS = ('invokeId', 'InvokeId')
+
+# OOS 模板所操作资源的 service，执行后使对应 service 的响应缓存失效
+TEMPLATE_SERVICES = {
+    'ACS-ECS-': 'ecs',
+    'ACS-RDS-': 'rds'
+}
+
 
 tools = []
 
+# 工具调用被客户端取消时，是否同时取消已启动的 OOS 执行
+_CANCEL_EXECUTION_ON_ABORT = False
+
+# 持有后台任务的引用，避免任务在完成前被回收
+_background_tasks = set()
+
+
+# 实例数不超过该值时，启动/停止/重启实例直接调用 ECS API 而不创建 OOS 执行；默认 0 表示关闭。
+# 直接调用时返回的执行没有 ExecutionId
+_DIRECT_API_THRESHOLD = 0
+
+# ECS StartInstances/StopInstances/RebootInstances 单次最多支持的实例数
+ECS_BATCH_SIZE = 100
+
+# 直接调用 ECS API 后等待实例状态的超时时间和轮询间隔（秒）
+DIRECT_API_TIMEOUT = 300
+DIRECT_API_POLL_INTERVAL = 1
+DIRECT_API_MAX_POLL_INTERVAL = 5
+
+[RUNNING, STOPPED] = ['Running', 'Stopped']
+
+
+def set_cancel_execution_on_abort(enabled: bool):
+    global _CANCEL_EXECUTION_ON_ABORT
+    _CANCEL_EXECUTION_ON_ABORT = enabled
+
+
+def set_direct_api_threshold(threshold: int):
+    global _DIRECT_API_THRESHOLD
+    _DIRECT_API_THRESHOLD = max(0, min(threshold, ECS_BATCH_SIZE))
+
+
+def _use_direct_api(instance_ids: list, wait_for_completion: bool) -> bool:
+    # 直接调用 ECS API 没有 ExecutionId，不支持 WaitForCompletion=false
+    return wait_for_completion and 0 < len(instance_ids) <= _DIRECT_API_THRESHOLD
+
 
 def create_client(region_id: str) -> oos20190601Client:
-    config = create_config()
-    config.endpoint = f'oos.{region_id}.aliyuncs.com'
-    return oos20190601Client(config)
+    endpoint = f'oos.{region_id}.aliyuncs.com'
 
+    def factory():
+        config = create_config()
+        config.endpoint = endpoint
+        return oos20190601Client(config)
 
-def _start_execution_sync(region_id: str, template_name: str, parameters: dict):
-    client = create_client(region_id=region_id)
+    return client_pool.get(('oos20190601Client', 'oos', endpoint, get_credential_fingerprint()), factory)
+
+
+def create_ecs_client(region_id: str) -> ecs20140526Client:
+    endpoint = f'ecs.{region_id}.aliyuncs.com'
+
+    def factory():
+        config = create_config()
+        config.endpoint = endpoint
+        return ecs20140526Client(config)
+
+    return client_pool.get(('ecs20140526Client', 'ecs', endpoint, get_credential_fingerprint()), factory)
+
+
+def _invalidate_response_cache(region_id: str, template_name: str):
+    for prefix, service in TEMPLATE_SERVICES.items():
+        if template_name.startswith(prefix):
+            response_cache.invalidate(service, region_id)
+
+
+def _wants_progress(ctx: Context) -> bool:
+    try:
+        meta = ctx.request_context.meta
+    except (AttributeError, ValueError):
+        return False
+    return meta is not None and meta.progressToken is not None
+
+
+async def _list_child_executions(client, region_id: str, execution_id: str) -> list:
+    children = []
+    next_token = None
+    while True:
+        list_executions_request = oos_20190601_models.ListExecutionsRequest(
+            region_id=region_id,
+            parent_execution_id=execution_id,
+            max_results=100,
+            next_token=next_token
+        )
+        list_executions_resp = await retry_policy.call_async(rate_limiter.call_async, 'oos', region_id,
+                                                             'ListExecutions', in_thread(client.list_executions),
+                                                             list_executions_request)
+        children.extend(list_executions_resp.body.executions or [])
+        next_token = list_executions_resp.body.next_token
+        if not next_token:
+            return children
+
+
+async def _count_child_executions(client, region_id: str, execution_id: str) -> dict:
+    """按状态统计子执行数量"""
+    counts = {}
+    for child in await _list_child_executions(client, region_id, execution_id):
+        counts[child.status] = counts.get(child.status, 0) + 1
+    return counts
+
+
+async def _report_execution_progress(ctx: Context, client, region_id: str, execution_id: str):
+    execution = execution_poller.get_state(client, execution_id)
+    status = execution.status if execution is not None else 'Running'
+    counts = await _count_child_executions(client, region_id, execution_id)
+    total = sum(counts.values())
+    completed = sum(counts.get(end_status, 0) for end_status in END_STATUSES)
+    message = (f'Execution {execution_id} {status}: {counts.get(SUCCESS, 0)} succeeded, '
+               f'{counts.get(FAILED, 0) + counts.get(CANCELLED, 0)} failed, {total - completed} running')
+    await ctx.report_progress(completed, total or None, message)
+
+
+async def _await_execution(ctx: Context, client, region_id: str, execution_id: str, future, timeout: float = None):
+    """等待轮询器返回的 Future，期间定期向客户端推送进度"""
+    wrapped = asyncio.wrap_future(future)
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    while True:
+        wait = PROGRESS_INTERVAL if _wants_progress(ctx) else None
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+            wait = remaining if wait is None else min(wait, remaining)
+        try:
+            done, _ = await asyncio.wait({wrapped}, timeout=wait)
+        except asyncio.CancelledError:
+            wrapped.cancel()
+            raise
+        if done:
+            return wrapped.result()
+        if deadline is not None and time.monotonic() >= deadline:
+            wrapped.cancel()
+            raise asyncio.TimeoutError()
+        try:
+            await _report_execution_progress(ctx, client, region_id, execution_id)
+        except Exception as e:
+            logger.info(f'Report progress of execution {execution_id} failed: {e}')
+
+
+async def _wait_execution(client, region_id: str, execution_id: str, start_date: str = None, timeout: float = None,
+                          ctx: Context = None, raise_on_failure: bool = True):
+    """等待执行结束，超时时返回最近一次查询到的执行状态"""
+    future = execution_poller.watch(client, region_id, execution_id, start_date)
+    try:
+        execution = await _await_execution(ctx, client, region_id, execution_id, future, timeout)
+    except asyncio.TimeoutError:
+        execution_poller.unwatch(execution_id, future)
+        return execution_poller.get_state(client, execution_id)
+    except asyncio.CancelledError:
+        # 没有其他等待方时轮询器不再查询该执行
+        execution_poller.unwatch(execution_id, future)
+        raise
+    if execution.status == FAILED and raise_on_failure:
+        raise exception.OOSExecutionFailed(reason=execution.status_message)
+    return execution
+
+
+async def _cancel_execution(client, region_id: str, execution_id: str):
+    cancel_execution_request = oos_20190601_models.CancelExecutionRequest(
+        region_id=region_id,
+        execution_id=execution_id
+    )
+    try:
+        await retry_policy.call_async(rate_limiter.call_async, 'oos', region_id, 'CancelExecution',
+                                      in_thread(client.cancel_execution), cancel_execution_request)
+        logger.info(f'Cancelled execution {execution_id} of the aborted tool call')
+    except Exception as e:
+        logger.warning(f'Cancel execution {execution_id} failed: {e}')
+
+
+def _cancel_execution_on_abort(client, region_id: str, execution_id: str):
+    if not _CANCEL_EXECUTION_ON_ABORT:
+        return
+    task = asyncio.ensure_future(_cancel_execution(client, region_id, execution_id))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _start_execution(client, region_id: str, template_name: str, parameters: dict):
     start_execution_request = oos_20190601_models.StartExecutionRequest(
         region_id=region_id,
         template_name=template_name,
-        parameters=json.dumps(parameters)
+        parameters=json.dumps(parameters),
+        client_token=str(uuid.uuid4())
     )
-    start_execution_resp = client.start_execution(start_execution_request)
-    execution_id = start_execution_resp.body.execution.execution_id
+    # 携带 ClientToken 的 StartExecution 是幂等的，可以安全重试
+    start_execution_resp = await retry_policy.call_async(rate_limiter.call_async, 'oos', region_id, 'StartExecution',
+                                                         in_thread(client.start_execution), start_execution_request)
+    _invalidate_response_cache(region_id, template_name)
+    return start_execution_resp.body.execution
 
-    while True:
-        list_executions_request = oos_20190601_models.ListExecutionsRequest(
+
+def _track_in_background(client, region_id: str, template_name: str, execution):
+    """后台继续跟踪执行状态，供 OOS_GetExecutionStatus / OOS_WaitExecution 使用"""
+    execution_poller.remember(client, oos_20190601_models.ListExecutionsResponseBodyExecutions().from_map(
+        execution.to_map()))
+    future = execution_poller.watch(client, region_id, execution.execution_id,
+                                    execution.start_date or execution.create_date)
+    future.add_done_callback(lambda _: _invalidate_response_cache(region_id, template_name))
+    return future
+
+
+async def _start_execution_async(region_id: str, template_name: str, parameters: dict,
+                                 wait_for_completion: bool = True, ctx: Context = None):
+    client = create_client(region_id=region_id)
+    execution = await _start_execution(client, region_id, template_name, parameters)
+    if not wait_for_completion:
+        _track_in_background(client, region_id, template_name, execution)
+        return oos_20190601_models.StartExecutionResponseBody(execution=execution)
+
+    try:
+        if _wants_progress(ctx):
+            await ctx.report_progress(0, None, f'Execution {execution.execution_id} started')
+        # 由共享轮询器批量查询执行状态，不占用线程等待
+        execution = await _wait_execution(client, region_id, execution.execution_id,
+                                          execution.start_date or execution.create_date, ctx=ctx)
+        return oos_20190601_models.ListExecutionsResponseBody(executions=[execution])
+    except asyncio.CancelledError:
+        _cancel_execution_on_abort(client, region_id, execution.execution_id)
+        raise
+    finally:
+        _invalidate_response_cache(region_id, template_name)
+
+
+def _with_resource_ids(parameters: dict, resource_ids: list) -> dict:
+    parameters = copy.deepcopy(parameters)
+    parameters['targets']['ResourceIds'] = resource_ids
+    return parameters
+
+
+async def _get_instance_statuses(client, region_id: str, execution_id: str):
+    """按实例返回子执行的状态，查询失败时返回 None"""
+    try:
+        children = await _list_child_executions(client, region_id, execution_id)
+    except Exception as e:
+        logger.info(f'List child executions of {execution_id} failed: {e}')
+        return None
+    return {_load_json(child.parameters).get('instanceId'): child.status for child in children}
+
+
+async def _start_bulk_execution_async(region_id: str, template_name: str, parameters: dict,
+                                      wait_for_completion: bool = True, ctx: Context = None):
+    """
+    目标数量超过分片大小时拆分为多个执行并发运行，并按实例汇总执行结果。
+    只有 StartExecution 失败（未创建执行）的分片会按 --oos-chunk-retries 重试；已创建的执行无论结果如何都不会重新执行，
+    以 Failed 结束的执行返回 ExecutionId 和各实例的状态，避免在已成功的实例上重复操作。
+    """
+    resource_ids = parameters['targets']['ResourceIds']
+    if len(resource_ids) <= chunk_scheduler.chunk_size:
+        return await _start_execution_async(region_id, template_name, parameters, wait_for_completion, ctx)
+
+    client = create_client(region_id=region_id)
+    # 未等待执行结束时，分片占用的并发名额在后台跟踪到执行结束后才释放
+    tracking = {}
+
+    async def start_chunk(chunk):
+        execution = await _start_execution(client, region_id, template_name, _with_resource_ids(parameters, chunk))
+        execution_id = execution.execution_id
+        if not wait_for_completion:
+            tracking[execution_id] = _track_in_background(client, region_id, template_name, execution)
+            return {'ExecutionId': execution_id, 'Status': execution.status}
+        try:
+            execution = await _wait_execution(client, region_id, execution_id,
+                                              execution.start_date or execution.create_date, raise_on_failure=False)
+        except asyncio.CancelledError:
+            _cancel_execution_on_abort(client, region_id, execution_id)
+            raise
+        except Exception as e:
+            # 执行已启动但状态未知，交给调用方通过 ExecutionId 确认
+            return {'ExecutionId': execution_id, 'Status': UNKNOWN, 'Error': str(e)}
+        finally:
+            _invalidate_response_cache(region_id, template_name)
+        result = {'ExecutionId': execution_id, 'Status': execution.status}
+        if execution.status == FAILED:
+            result['StatusMessage'] = execution.status_message
+            result['Instances'] = await _get_instance_statuses(client, region_id, execution_id)
+        return result
+
+    # 分片模式下按得到最终结果的实例数推送进度
+    completed = [0]
+
+    async def on_chunk_done(chunk, result, error):
+        completed[0] += len(chunk)
+        if _wants_progress(ctx):
+            await ctx.report_progress(completed[0], len(resource_ids),
+                                      f'{completed[0]} of {len(resource_ids)} instances processed')
+
+    def hold(result):
+        return tracking.pop(result['ExecutionId'], None)
+
+    executions = []
+    succeeded, failed, unknown = [], [], []
+    for chunk, result, error in await chunk_scheduler.run(resource_ids, start_chunk, on_chunk_done, hold):
+        if error is not None:
+            # StartExecution 失败，没有创建执行
+            failed.extend(chunk)
+            executions.append({'Status': FAILED, 'Error': str(error), 'InstanceIds': chunk})
+            continue
+        executions.append(dict(result, InstanceIds=chunk))
+        if result['Status'] == UNKNOWN:
+            unknown.extend(chunk)
+        elif result['Status'] == FAILED and result['Instances'] is not None:
+            for instance_id in chunk:
+                (succeeded if result['Instances'].get(instance_id) == SUCCESS else failed).append(instance_id)
+        elif result['Status'] in (FAILED, CANCELLED):
+            failed.extend(chunk)
+        else:
+            # 未等待执行结束时，成功表示执行已启动
+            succeeded.extend(chunk)
+    return {
+        'Executions': executions,
+        'SucceededInstanceIds': succeeded,
+        'FailedInstanceIds': failed,
+        # 执行已启动但未能确认结果的实例，不应直接重试
+        'UnknownInstanceIds': unknown
+    }
+
+
+def _load_json(value) -> dict:
+    if isinstance(value, dict):
+        return value
+    try:
+        value = json.loads(value) if value else {}
+    except (TypeError, ValueError):
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _truncate_output(output: str, max_bytes: int):
+    """按 UTF-8 字节数截断输出，返回 (输出, 是否截断)"""
+    data = (output or '').encode('utf-8')
+    if len(data) <= max_bytes:
+        return output or '', False
+    return data[:max_bytes].decode('utf-8', errors='ignore'), True
+
+
+async def _get_invocation_output(client, ecs_client, region_id: str, child, instance_id: str) -> str:
+    """优先读取子执行的 Outputs，没有时通过任务执行中的 InvokeId 查询云助手命令的执行结果"""
+    outputs = _load_json(child.outputs)
+    for key in INVOCATION_OUTPUT_KEYS:
+        if key in outputs:
+            return str(outputs[key])
+    list_task_executions_request = oos_20190601_models.ListTaskExecutionsRequest(
+        region_id=region_id,
+        execution_id=child.execution_id
+    )
+    list_task_executions_resp = await retry_policy.call_async(rate_limiter.call_async, 'oos', region_id,
+                                                              'ListTaskExecutions',
+                                                              in_thread(client.list_task_executions),
+                                                              list_task_executions_request)
+    for task_execution in reversed(list_task_executions_resp.body.task_executions or []):
+        task_outputs = _load_json(task_execution.outputs)
+        for key in INVOCATION_OUTPUT_KEYS:
+            if key in task_outputs:
+                return str(task_outputs[key])
+        invoke_id = next((task_outputs[key] for key in INVOKE_ID_KEYS if task_outputs.get(key)), None)
+        if invoke_id is None:
+            continue
+        describe_invocation_results_request = ecs_20140526_models.DescribeInvocationResultsRequest(
             region_id=region_id,
-            execution_id=execution_id
+            invoke_id=invoke_id,
+            instance_id=instance_id,
+            content_encoding='PlainText'
         )
-        list_executions_resp = client.list_executions(list_executions_request)
-        status = list_executions_resp.body.executions[0].status
-        if status == FAILED:
-            status_message = list_executions_resp.body.executions[0].status_message
-            raise exception.OOSExecutionFailed(reason=status_message)
-        elif status in END_STATUSES:
-            return list_executions_resp.body
-        time.sleep(1)
+        describe_invocation_results_resp = await retry_policy.call_async(
+            rate_limiter.call_async, 'ecs', region_id, 'DescribeInvocationResults',
+            in_thread(ecs_client.describe_invocation_results), describe_invocation_results_request)
+        invocation = describe_invocation_results_resp.body.invocation
+        results = invocation.invocation_results.invocation_result if invocation.invocation_results else []
+        return results[0].output or '' if results else ''
+    return ''
+
+
+async def _collect_command_outputs(client, region_id: str, execution_ids: list, max_output_bytes: int,
+                                   ctx: Context = None) -> list:
+    """并发读取各子执行的命令输出，每完成一台实例即通过日志和进度通知推送给客户端"""
+    children = []
+    for execution_id in execution_ids:
+        children.extend(await _list_child_executions(client, region_id, execution_id))
+    ecs_client = create_ecs_client(region_id)
+    semaphore = asyncio.Semaphore(OUTPUT_CONCURRENCY)
+    completed = [0]
+
+    async def collect(child):
+        instance_id = _load_json(child.parameters).get('instanceId')
+        result = {
+            'InstanceId': instance_id,
+            'ExecutionId': child.execution_id,
+            'Status': child.status
+        }
+        if child.status_message:
+            result['StatusMessage'] = child.status_message
+        async with semaphore:
+            try:
+                output = await _get_invocation_output(client, ecs_client, region_id, child, instance_id)
+            except Exception as e:
+                output = ''
+                result['Error'] = str(e)
+        result['Output'], result['Truncated'] = _truncate_output(output, max_output_bytes)
+        completed[0] += 1
+        if ctx is not None:
+            try:
+                await ctx.info(f'[{completed[0]}/{len(children)}] {instance_id} {child.status}:\n{result["Output"]}')
+                if _wants_progress(ctx):
+                    await ctx.report_progress(completed[0], len(children), f'Collected output of {instance_id}')
+            except Exception as e:
+                logger.info(f'Stream output of {instance_id} failed: {e}')
+        return result
+
+    return list(await asyncio.gather(*[collect(child) for child in children]))
+
+
+async def _run_command_with_outputs(region_id: str, parameters: dict, max_output_bytes: int, ctx: Context = None):
+    client = create_client(region_id=region_id)
+    started = await _start_bulk_execution_async(region_id, 'ACS-ECS-BulkyRunCommand', parameters,
+                                                wait_for_completion=False)
+    if isinstance(started, dict):
+        execution_ids = [item['ExecutionId'] for item in started['Executions'] if 'ExecutionId' in item]
+        failed = started['FailedInstanceIds']
+    else:
+        execution_ids = [started.execution.execution_id]
+        failed = []
+    try:
+        # 命令在部分实例上失败时仍需要收集输出，因此不在执行失败时抛出异常
+        executions = await asyncio.gather(*[
+            _wait_execution(client, region_id, execution_id, ctx=ctx if len(execution_ids) == 1 else None,
+                            raise_on_failure=False)
+            for execution_id in execution_ids
+        ])
+    except asyncio.CancelledError:
+        for execution_id in execution_ids:
+            execution_poller.unwatch(execution_id)
+            _cancel_execution_on_abort(client, region_id, execution_id)
+        raise
+    return {
+        'Executions': [execution.to_map() for execution in executions if execution is not None],
+        'Outputs': await _collect_command_outputs(client, region_id, execution_ids, max_output_bytes, ctx),
+        'FailedInstanceIds': failed
+    }
+
+
+async def _wait_instance_status(ecs_client, region_id: str, instance_ids: list, target_status: str,
+                                transitioned: set = None, ctx: Context = None) -> dict:
+    """
+    批量查询实例状态直到全部达到 target_status 或超时，返回 instance_id -> 状态。
+    transitioned 为已离开原状态的实例，不为 None 时只有离开过原状态的实例才算完成（用于重启）。
+    """
+    statuses = {}
+    pending = list(instance_ids)
+    require_transition = transitioned is not None
+    deadline = time.monotonic() + DIRECT_API_TIMEOUT
+    interval = DIRECT_API_POLL_INTERVAL
+    while pending and time.monotonic() < deadline:
+        await asyncio.sleep(interval)
+        interval = min(DIRECT_API_MAX_POLL_INTERVAL, interval * 1.5)
+        describe_instance_status_request = ecs_20140526_models.DescribeInstanceStatusRequest(
+            region_id=region_id,
+            instance_id=pending,
+            page_size=ECS_BATCH_SIZE
+        )
+        describe_instance_status_resp = await retry_policy.call_async(
+            rate_limiter.call_async, 'ecs', region_id, 'DescribeInstanceStatus',
+            in_thread(ecs_client.describe_instance_status), describe_instance_status_request)
+        instance_statuses = describe_instance_status_resp.body.instance_statuses
+        for instance_status in (instance_statuses.instance_status if instance_statuses else None) or []:
+            statuses[instance_status.instance_id] = instance_status.status
+            if instance_status.status != target_status and require_transition:
+                transitioned.add(instance_status.instance_id)
+        pending = [instance_id for instance_id in pending if statuses.get(instance_id) != target_status
+                   or (require_transition and instance_id not in transitioned)]
+        if _wants_progress(ctx):
+            completed = len(instance_ids) - len(pending)
+            await ctx.report_progress(completed, len(instance_ids),
+                                      f'{completed} of {len(instance_ids)} instances {target_status}')
+    return statuses
+
+
+async def _ecs_instance_action_async(region_id: str, action: str, template_name: str, instance_ids: list,
+                                     force_stop: bool = False, ctx: Context = None):
+    """
+    少量实例直接调用 ECS 批量 API，省去 OOS 执行的编排开销。
+    返回与等待 OOS 执行结束时相同的 ListExecutionsResponseBody，但没有 ExecutionId，
+    各实例的结果以 JSON 写在执行的 Outputs 中。
+    """
+    ecs_client = create_ecs_client(region_id)
+    if action == 'StartInstances':
+        request = ecs_20140526_models.StartInstancesRequest(region_id=region_id, instance_id=instance_ids,
+                                                            batch_optimization='SuccessFirst')
+        func, target_status = in_thread(ecs_client.start_instances), RUNNING
+    elif action == 'StopInstances':
+        request = ecs_20140526_models.StopInstancesRequest(region_id=region_id, instance_id=instance_ids,
+                                                           force_stop=force_stop, batch_optimization='SuccessFirst')
+        func, target_status = in_thread(ecs_client.stop_instances), STOPPED
+    else:
+        request = ecs_20140526_models.RebootInstancesRequest(region_id=region_id, instance_id=instance_ids,
+                                                             force_reboot=force_stop, batch_optimization='SuccessFirst')
+        func, target_status = in_thread(ecs_client.reboot_instances), RUNNING
+    start_date = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    try:
+        response = await retry_policy.call_async(rate_limiter.call_async, 'ecs', region_id, action, func, request,
+                                                 idempotent=False)
+        instance_responses = response.body.instance_responses
+        instance_responses = (instance_responses.instance_response if instance_responses else None) or []
+        # 与 OOS 模板一致，已处于目标状态的实例视为成功（重启除外）
+        already = {item.instance_id for item in instance_responses
+                   if str(item.code) != '200' and item.current_status == target_status
+                   and action != 'RebootInstances'}
+        errors = {item.instance_id: f'{item.code}: {item.message}' for item in instance_responses
+                  if str(item.code) != '200' and item.instance_id not in already}
+        accepted = [instance_id for instance_id in instance_ids
+                    if instance_id not in errors and instance_id not in already]
+        # 重启的实例在到达 Running 之前需要先离开 Running 状态
+        transitioned = {item.instance_id for item in instance_responses
+                        if item.current_status != target_status} if action == 'RebootInstances' else None
+        statuses = await _wait_instance_status(ecs_client, region_id, accepted, target_status, transitioned, ctx)
+    finally:
+        response_cache.invalidate('ecs', region_id)
+
+    instances = {}
+    for instance_id in instance_ids:
+        if instance_id in already:
+            instances[instance_id] = {'Status': SUCCESS, 'InstanceStatus': target_status}
+        elif instance_id in errors:
+            instances[instance_id] = {'Status': FAILED, 'Error': errors[instance_id]}
+        elif statuses.get(instance_id) == target_status and (transitioned is None or instance_id in transitioned):
+            instances[instance_id] = {'Status': SUCCESS, 'InstanceStatus': target_status}
+        else:
+            instances[instance_id] = {'Status': FAILED, 'InstanceStatus': statuses.get(instance_id),
+                                      'Error': f'Instance did not reach {target_status} in {DIRECT_API_TIMEOUT}s'}
+    failed = [instance_id for instance_id, instance in instances.items() if instance['Status'] == FAILED]
+    execution = oos_20190601_models.ListExecutionsResponseBodyExecutions(
+        template_name=template_name,
+        mode='Automatic',
+        status=FAILED if failed else SUCCESS,
+        status_message=f'Failed instances: {", ".join(failed)}' if failed else None,
+        start_date=start_date,
+        end_date=time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        outputs=json.dumps({'Instances': instances})
+    )
+    return oos_20190601_models.ListExecutionsResponseBody(executions=[execution])
+
+
 @tools.append
-def OOS_RunCommand(
+async def OOS_RunCommand(
     Command: str = Field(description='Content of the command executed on the ECS instance'),
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
-    CommandType: str = Field(description='The type of command executed on the ECS instance, optional value：RunShellScript，RunPythonScript，RunPerlScript，RunBatScript，RunPowerShellScript', default='RunShellScript')
+    CommandType: str = Field(description='The type of command executed on the ECS instance, optional value：RunShellScript，RunPythonScript，RunPerlScript，RunBatScript，RunPowerShellScript', default='RunShellScript'),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    CollectOutputs: bool = Field(description='Whether to collect the command output of every instance, only takes effect when WaitForCompletion is true', default=False),
+    MaxOutputBytes: int = Field(description='Max bytes of the collected command output of each instance, longer output is truncated', default=4096),
+    ctx: Context = None
 ):
     """批量在多台ECS实例上运行云助手命令，适用于需要同时管理多台ECS实例的场景，如应用程序管理和资源标记操作等。"""
     
@@ -69,13 +616,18 @@ def OOS_RunCommand(
         "commandType": CommandType,
         "commandContent": Command
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-ECS-BulkyRunCommand', parameters=parameters)
+    if CollectOutputs and WaitForCompletion:
+        return await _run_command_with_outputs(RegionId, parameters, MaxOutputBytes, ctx)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-ECS-BulkyRunCommand',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
     
 
 @tools.append
-def OOS_StartInstances(
+async def OOS_StartInstances(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量启动ECS实例，适用于需要同时管理和启动多台ECS实例的场景，例如应用部署和高可用性场景。"""
     
@@ -88,14 +640,20 @@ def OOS_StartInstances(
             'Type': 'ResourceIds'
         }
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-ECS-BulkyStartInstances', parameters=parameters)
+    if _use_direct_api(InstanceIds, WaitForCompletion):
+        return await _ecs_instance_action_async(RegionId, 'StartInstances', 'ACS-ECS-BulkyStartInstances', InstanceIds,
+                                                ctx=ctx)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-ECS-BulkyStartInstances',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
 
 
 @tools.append
-def OOS_StopInstances(
+async def OOS_StopInstances(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
-    ForeceStop: bool = Field(description='Is forced shutdown required', default=False)
+    ForeceStop: bool = Field(description='Is forced shutdown required', default=False),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量停止ECS实例，适用于需要同时管理和停止多台ECS实例的场景。"""
     
@@ -109,14 +667,20 @@ def OOS_StopInstances(
         },
         'forceStop': ForeceStop
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-ECS-BulkyStopInstances', parameters=parameters)
+    if _use_direct_api(InstanceIds, WaitForCompletion):
+        return await _ecs_instance_action_async(RegionId, 'StopInstances', 'ACS-ECS-BulkyStopInstances', InstanceIds,
+                                                force_stop=ForeceStop, ctx=ctx)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-ECS-BulkyStopInstances',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
 
 
 @tools.append
-def OOS_RebootInstances(
+async def OOS_RebootInstances(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
-    ForeceStop: bool = Field(description='Is forced shutdown required', default=False)
+    ForeceStop: bool = Field(description='Is forced shutdown required', default=False),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量重启ECS实例，适用于需要同时管理和重启多台ECS实例的场景。"""
     
@@ -130,18 +694,24 @@ def OOS_RebootInstances(
         },
         'forceStop': ForeceStop
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-ECS-BulkyRebootInstances', parameters=parameters)
+    if _use_direct_api(InstanceIds, WaitForCompletion):
+        return await _ecs_instance_action_async(RegionId, 'RebootInstances', 'ACS-ECS-BulkyRebootInstances', InstanceIds,
+                                                force_stop=ForeceStop, ctx=ctx)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-ECS-BulkyRebootInstances',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
 
 
 @tools.append
-def OOS_RunInstances(
+async def OOS_RunInstances(
     ImageId: str = Field(description='Image ID'),
     InstanceType: str = Field(description='Instance Type'),
     SecurityGroupId: str = Field(description='SecurityGroup ID'),
     VSwitchId: str = Field(description='VSwitch ID'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
     Amount: int = Field(description='Number of ECS instances', default=1),
-    InstanceName: str = Field(description='Instance Name', default='')
+    InstanceName: str = Field(description='Instance Name', default=''),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量创建ECS实例，适用于需要同时创建多台ECS实例的场景，例如应用部署和高可用性场景。"""
 
@@ -153,14 +723,17 @@ def OOS_RunInstances(
         'amount': Amount,
         'instanceName': InstanceName
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-ECS-RunInstances', parameters=parameters)
+    return await _start_execution_async(region_id=RegionId, template_name='ACS-ECS-RunInstances', parameters=parameters,
+                                        wait_for_completion=WaitForCompletion, ctx=ctx)
 
 
 @tools.append
-def OOS_ResetPassword(
+async def OOS_ResetPassword(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     Password: str = Field(description='The password of the ECS instance must be 8-30 characters and must contain only the following characters: lowercase letters, uppercase letters, numbers, and special characters only.（）~！@#$%^&*-_+=（40：<>，？/'),
     RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量修改ECS实例的密码，请注意，本操作将会重启ECS实例"""
     parameters = {
@@ -173,13 +746,16 @@ def OOS_ResetPassword(
         },
         'password': Password
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-ECS-BulkyResetPassword', parameters=parameters)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-ECS-BulkyResetPassword',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
 
 @tools.append
-def OOS_ReplaceSystemDisk(
+async def OOS_ReplaceSystemDisk(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
     ImageId: str = Field(description='Image ID'),
-    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
+    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量替换ECS实例的系统盘，更换操作系统"""
     parameters = {
@@ -192,13 +768,16 @@ def OOS_ReplaceSystemDisk(
         },
         'imageId': ImageId
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-ECS-BulkyReplaceSystemDisk', parameters=parameters)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-ECS-BulkyReplaceSystemDisk',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
 
 
 @tools.append
-def OOS_StartRDSInstances(
+async def OOS_StartRDSInstances(
     InstanceIds: List[str] = Field(description='AlibabaCloud ECS instance ID List'),
-    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
+    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量启动RDS实例，适用于需要同时管理和启动多台RDS实例的场景，例如应用部署和高可用性场景。"""
 
@@ -211,13 +790,16 @@ def OOS_StartRDSInstances(
             'Type': 'ResourceIds'
         }
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-RDS-BulkyStartInstances', parameters=parameters)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-RDS-BulkyStartInstances',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
 
 
 @tools.append
-def OOS_StopRDSInstances(
+async def OOS_StopRDSInstances(
     InstanceIds: List[str] = Field(description='AlibabaCloud RDS instance ID List'),
-    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
+    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量停止RDS实例，适用于需要同时管理和停止多台RDS实例的场景。"""
 
@@ -230,13 +812,16 @@ def OOS_StopRDSInstances(
             'Type': 'ResourceIds'
         }
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-RDS-BulkyStopInstances', parameters=parameters)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-RDS-BulkyStopInstances',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
 
 
 @tools.append
-def OOS_RebootRDSInstances(
+async def OOS_RebootRDSInstances(
     InstanceIds: List[str] = Field(description='AlibabaCloud RDS instance ID List'),
-    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
+    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
+    WaitForCompletion: bool = Field(description='Whether to wait until the execution finishes. If false, return the ExecutionId immediately and get the result with OOS_WaitExecution or OOS_GetExecutionStatus', default=True),
+    ctx: Context = None
 ):
     """批量重启RDS实例，适用于需要同时管理和重启多台RDS实例的场景。"""
 
@@ -249,5 +834,48 @@ def OOS_RebootRDSInstances(
             'Type': 'ResourceIds'
         }
     }
-    return _start_execution_sync(region_id=RegionId, template_name='ACS-RDS-BulkyRestartInstances',
-                                 parameters=parameters)
+    return await _start_bulk_execution_async(region_id=RegionId, template_name='ACS-RDS-BulkyRestartInstances',
+                                             parameters=parameters, wait_for_completion=WaitForCompletion, ctx=ctx)
+
+
+async def _get_execution_status(client, region_id: str, execution_id: str):
+    execution = execution_poller.get_state(client, execution_id)
+    if execution is not None and (execution.status in END_STATUSES or execution_poller.is_watching(execution_id)):
+        return execution
+    list_executions_request = oos_20190601_models.ListExecutionsRequest(
+        region_id=region_id,
+        execution_id=execution_id
+    )
+    list_executions_resp = await retry_policy.call_async(rate_limiter.call_async, 'oos', region_id, 'ListExecutions',
+                                                         in_thread(client.list_executions), list_executions_request)
+    executions = list_executions_resp.body.executions
+    if not executions:
+        raise exception.OOSExecutionNotFound(execution_id=execution_id)
+    execution_poller.remember(client, executions[0])
+    return executions[0]
+
+
+@tools.append
+async def OOS_GetExecutionStatus(
+    ExecutionId: str = Field(description='OOS execution ID'),
+    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou')
+):
+    """查询OOS执行的状态，优先返回缓存的执行状态，适用于查询以 WaitForCompletion=false 方式启动的批量操作。"""
+    client = create_client(region_id=RegionId)
+    execution = await _get_execution_status(client, RegionId, ExecutionId)
+    return oos_20190601_models.ListExecutionsResponseBody(executions=[execution])
+
+
+@tools.append
+async def OOS_WaitExecution(
+    ExecutionId: str = Field(description='OOS execution ID'),
+    RegionId: str = Field(description='AlibabaCloud region ID', default='cn-hangzhou'),
+    Timeout: int = Field(description='Max seconds to wait, return the current status of the execution on timeout', default=60),
+    ctx: Context = None
+):
+    """等待OOS执行结束并返回执行结果，超时后返回执行的当前状态，适用于等待以 WaitForCompletion=false 方式启动的批量操作。"""
+    client = create_client(region_id=RegionId)
+    execution = await _wait_execution(client, RegionId, ExecutionId, timeout=Timeout, ctx=ctx)
+    if execution is None:
+        execution = await _get_execution_status(client, RegionId, ExecutionId)
+    return oos_20190601_models.ListExecutionsResponseBody(executions=[execution])
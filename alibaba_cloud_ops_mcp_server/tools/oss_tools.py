@@ -2,11 +2,11 @@
 import os
 import alibabacloud_oss_v2 as oss
 from alibaba_cloud_ops_mcp_server.alibabacloud.utils import get_credentials_from_header
+from alibaba_cloud_ops_mcp_server.alibabacloud.credential_cache import get_credentials_client
 
 from pydantic import Field
 from alibabacloud_oss_v2 import Credentials
 from alibabacloud_oss_v2.credentials import EnvironmentVariableCredentialsProvider
-from alibabacloud_credentials.client import Client as CredClient
 
 
 tools = []
@@ -14,22 +14,15 @@ tools = []
 
 class CredentialsProvider(EnvironmentVariableCredentialsProvider):
     def __init__(self) -> None:
-        credentials = get_credentials_from_header()
-        if credentials:
-            access_key_id = credentials.get('AccessKeyId', None)
-            access_key_secret = credentials.get('AccessKeySecret', None)
-            session_token = credentials.get('SecurityToken', None)
-        else:
-            credentialsClient = CredClient()
-            access_key_id = credentialsClient.get_credential().access_key_id
-            access_key_secret = credentialsClient.get_credential().access_key_secret
-            session_token = credentialsClient.get_credential().security_token
-
-        self._credentials = Credentials(
-            access_key_id, access_key_secret, session_token)
+        self._header_credentials = get_credentials_from_header()
 
     def get_credentials(self) -> Credentials:
-        return self._credentials
+        credentials = self._header_credentials
+        if credentials:
+            return Credentials(credentials.get('AccessKeyId', None), credentials.get('AccessKeySecret', None),
+                               credentials.get('SecurityToken', None))
+        credential = get_credentials_client().get_credential()
+        return Credentials(credential.access_key_id, credential.access_key_secret, credential.security_token)
 
 
 def create_client(region_id: str) -> oss.Client:
@@ -0,0 +1,135 @@
+import json
+import threading
+
+import pytest
+import requests
+from alibabacloud_oos20190601 import models as oos_20190601_models
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.api_meta_client import ApiMetaClient
+from alibaba_cloud_ops_mcp_server.alibabacloud.meta_cache import ApiMetaCache
+from alibaba_cloud_ops_mcp_server.tools import api_tools
+
+START_DATE = '2026-01-01T00:00:00Z'
+
+ECS_API_PATH = 'products/Ecs/versions/2014-05-26/apis/{}/api.json'
+
+
+def _api(summary, *parameters, methods=('post',)):
+    return {'summary': summary, 'methods': list(methods), 'path': '/',
+            'parameters': [{'name': name, 'in': 'query', 'schema': schema} for name, schema in parameters]}
+
+
+META_DOCS = {
+    'products.json': [{'code': 'Ecs', 'defaultVersion': '2014-05-26', 'name': 'ECS', 'style': 'RPC'}],
+    'products/Ecs/versions/2014-05-26/overview.json': {
+        'apis': {'DescribeInstances': {}, 'DescribeRegions': {}, 'StartInstances': {}},
+        'components': {'schemas': {}}
+    },
+    ECS_API_PATH.format('DescribeInstances'): _api(
+        'Describe instances',
+        ('RegionId', {'type': 'string', 'required': True}),
+        ('InstanceIds', {'type': 'string'}),
+        ('PageNumber', {'type': 'integer'}),
+        ('PageSize', {'type': 'integer'})),
+    ECS_API_PATH.format('DescribeRegions'): _api('Describe regions', ('RegionId', {'type': 'string'})),
+    ECS_API_PATH.format('StartInstances'): _api(
+        'Start instances',
+        ('RegionId', {'type': 'string', 'required': True}),
+        ('InstanceId', {'type': 'array'}),
+        ('ClientToken', {'type': 'string'})),
+}
+
+
+class FakeOOSClient:
+    """
+    内存中的 OOS client。
+    新启动的执行在第一次被 ListExecutions 查询到时结束，各实例的结果由 execute(resource_ids) 决定，默认全部成功；
+    也可以通过 set_status 直接设置执行状态。
+    """
+
+    def __init__(self):
+        self.execute = None
+        self.started = []
+        self.list_requests = []
+        self._statuses = {}
+        self._pending = {}
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def set_status(self, execution_id, status):
+        with self._lock:
+            self._statuses[execution_id] = status
+
+    def start_execution(self, request):
+        resource_ids = json.loads(request.parameters)['targets']['ResourceIds']
+        with self._lock:
+            self.started.append(resource_ids)
+            execution_id = f'exec-{len(self.started)}'
+            self._statuses[execution_id] = 'Running'
+            self._pending[execution_id] = resource_ids
+        execution = oos_20190601_models.StartExecutionResponseBodyExecution(
+            execution_id=execution_id, status='Running', start_date=START_DATE)
+        return oos_20190601_models.StartExecutionResponse(
+            body=oos_20190601_models.StartExecutionResponseBody(execution=execution))
+
+    def list_executions(self, request):
+        with self._lock:
+            self.list_requests.append(request)
+            if request.parent_execution_id:
+                executions = [self._execution(f'{request.parent_execution_id}-{instance_id}', status,
+                                              json.dumps({'instanceId': instance_id}))
+                              for instance_id, status in self._children.get(request.parent_execution_id, {}).items()]
+            else:
+                self._finish_pending()
+                executions = [self._execution(execution_id, status)
+                              for execution_id, status in self._statuses.items()
+                              if request.execution_id in (None, execution_id)]
+        body = oos_20190601_models.ListExecutionsResponseBody(executions=executions)
+        return oos_20190601_models.ListExecutionsResponse(body=body)
+
+    def _finish_pending(self):
+        for execution_id, resource_ids in self._pending.items():
+            statuses = self.execute(resource_ids) if self.execute else dict.fromkeys(resource_ids, 'Success')
+            self._children[execution_id] = statuses
+            self._statuses[execution_id] = 'Success' if set(statuses.values()) == {'Success'} else 'Failed'
+        self._pending.clear()
+
+    @staticmethod
+    def _execution(execution_id, status, parameters=None):
+        return oos_20190601_models.ListExecutionsResponseBodyExecutions(
+            execution_id=execution_id, status=status, start_date=START_DATE, parameters=parameters,
+            status_message='failed' if status == 'Failed' else None)
+
+
+@pytest.fixture
+def oos_client():
+    return FakeOOSClient()
+
+
+class FakeMetaSession:
+    """按 META_DOCS 返回元数据的 HTTP session，记录请求的路径"""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.paths = []
+
+    def get(self, url, headers=None, timeout=None):
+        path = url.split('/meta/v1/')[1]
+        self.paths.append(path)
+        response = requests.Response()
+        response.status_code = 200 if path in self.docs else 404
+        response._content = json.dumps(self.docs.get(path, {'Code': 'NotFound'})).encode('utf-8')
+        return response
+
+
+@pytest.fixture
+def meta_session(monkeypatch, tmp_path):
+    """使用临时缓存目录和 FakeMetaSession 的 ApiMetaClient，并清空调用计划缓存"""
+    session = FakeMetaSession(dict(META_DOCS))
+    monkeypatch.setattr(ApiMetaClient, 'get_session', classmethod(lambda cls: session))
+    monkeypatch.setattr(ApiMetaClient, 'snapshot', None)
+    monkeypatch.setattr(ApiMetaClient, 'cache', ApiMetaCache(cache_dir=str(tmp_path)))
+    monkeypatch.setattr(api_tools, '_CALL_PLANS', {})
+    ApiMetaClient.reset_catalog()
+    yield session
+    ApiMetaClient.reset_catalog()
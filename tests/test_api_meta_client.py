@@ -0,0 +1,38 @@
+from alibaba_cloud_ops_mcp_server.alibabacloud.api_meta_client import ApiMetaClient
+
+from conftest import ECS_API_PATH
+
+
+def test_standard_names_are_resolved_case_insensitively(meta_session):
+    assert ApiMetaClient.get_standard_service_and_api('ECS', 'describeinstances', '2014-05-26') == \
+        ('Ecs', 'DescribeInstances')
+    assert ApiMetaClient.get_standard_service_and_api('ecs', 'NoSuchApi', '2014-05-26') == ('Ecs', None)
+    assert ApiMetaClient.get_standard_service_and_api('nosuchservice', 'DescribeInstances') == (None, None)
+    # products.json 和 overview 只加载一次
+    assert meta_session.paths.count('products.json') == 1
+
+
+def test_local_api_meta_uses_cached_documents_only(meta_session):
+    assert ApiMetaClient.get_local_api_meta('ecs', 'DescribeInstances') is None
+    assert meta_session.paths == []
+
+    ApiMetaClient.get_api_meta('ecs', 'DescribeInstances')
+    requested = list(meta_session.paths)
+    ApiMetaClient.reset_catalog()
+
+    meta = ApiMetaClient.get_local_api_meta('ECS', 'describeinstances')
+    assert meta['summary'] == 'Describe instances'
+    # StartInstances 的 API 文档还没有缓存
+    assert ApiMetaClient.get_local_api_meta('ecs', 'StartInstances') is None
+    assert ApiMetaClient.get_local_api_meta('ecs', 'NoSuchApi') is None
+    assert meta_session.paths == requested
+
+
+def test_local_api_meta_sees_overview_cached_later(meta_session):
+    ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_PRODUCT_LIST)
+    assert ApiMetaClient.get_local_api_meta('ecs', 'DescribeRegions') is None
+
+    ApiMetaClient.get_api_meta('ecs', 'DescribeRegions')
+
+    assert ApiMetaClient.get_local_api_meta('ecs', 'describeregions')['summary'] == 'Describe regions'
+    assert ECS_API_PATH.format('DescribeRegions') in meta_session.paths
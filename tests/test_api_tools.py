@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from fastmcp import FastMCP, Client
+
+from alibaba_cloud_ops_mcp_server.alibabacloud import exception
+from alibaba_cloud_ops_mcp_server.tools import api_tools
+
+warm_up_call_plans = api_tools._warm_up_call_plans
+
+
+@pytest.fixture
+def api_calls(monkeypatch):
+    """记录工具展开后的 API 参数，不发起调用"""
+    calls = []
+
+    async def call(service, api, parameters, ctx=None):
+        calls.append({name: value for name, value in parameters.items() if value is not None})
+        return {'RequestId': len(calls)}
+
+    monkeypatch.setattr(api_tools, '_tools_api_call_async', call)
+    return calls
+
+
+@pytest.fixture
+def lazy_mcp(monkeypatch, meta_session):
+    """懒加载注册的工具，不启动后台预热"""
+    monkeypatch.setattr(api_tools, '_warm_up_call_plans', lambda *args: None)
+    monkeypatch.setattr(api_tools, '_LAZY_TOOLS', {})
+    mcp = FastMCP('test')
+    api_tools.create_api_tools(mcp, {'ecs': ['DescribeInstances', 'DescribeRegions']}, lazy=True)
+    return mcp
+
+
+def test_lazy_tool_is_materialized_in_place_after_first_call(lazy_mcp, api_calls):
+    notifications = []
+
+    async def on_message(message):
+        notifications.append(type(message.root).__name__)
+
+    async def main():
+        async with Client(lazy_mcp, message_handler=on_message) as client:
+            tools = await client.list_tools()
+            assert list(tools[0].inputSchema['properties']) == ['RegionId', 'Parameters']
+            await client.call_tool('ECS_DescribeInstances', {'Parameters': {'RegionId': 'cn-beijing', 'PageSize': 5}})
+            tools = await client.list_tools()
+            # 客户端缓存的最小参数定义仍然可用
+            await client.call_tool('ECS_DescribeInstances', {'Parameters': {'RegionId': 'cn-beijing'}})
+            await client.call_tool('ECS_DescribeInstances', {'RegionId': 'cn-qingdao', 'PageSize': 3})
+            await asyncio.sleep(0.05)
+            return tools
+
+    tools = asyncio.run(main())
+
+    assert [tool.name for tool in tools] == ['ECS_DescribeInstances', 'ECS_DescribeRegions']
+    schema = tools[0].inputSchema
+    assert {'RegionId', 'InstanceIds', 'PageSize', 'Parameters'} <= set(schema['properties'])
+    assert schema['required'] == ['RegionId']
+    assert api_calls == [{'RegionId': 'cn-beijing', 'PageSize': 5}, {'RegionId': 'cn-beijing'},
+                         {'RegionId': 'cn-qingdao', 'PageSize': 3}]
+    assert 'ToolListChangedNotification' in notifications
+
+
+def test_parameters_override_defaulted_arguments(lazy_mcp, api_calls, monkeypatch):
+    monkeypatch.setattr(api_tools, '_materialize_lazy_tool_async', lambda service, api: asyncio.sleep(0))
+
+    async def main():
+        async with Client(lazy_mcp) as client:
+            await client.call_tool('ECS_DescribeRegions', {'Parameters': {'RegionId': 'cn-beijing'}})
+            await client.call_tool('ECS_DescribeRegions', {'RegionId': 'cn-shanghai', 'Parameters': {'X': 1}})
+            await client.call_tool('ECS_DescribeRegions', {})
+
+    asyncio.run(main())
+
+    assert api_calls == [{'RegionId': 'cn-beijing'}, {'RegionId': 'cn-shanghai', 'X': 1}, {'RegionId': 'cn-hangzhou'}]
+
+
+def test_warm_up_materializes_lazy_tools(lazy_mcp):
+    warm_up_call_plans([('ecs', 'DescribeInstances'), ('ecs', 'DescribeRegions')], 2)
+
+    tools = asyncio.run(lazy_mcp.get_tools())
+    assert list(tools) == ['ECS_DescribeInstances', 'ECS_DescribeRegions']
+    assert 'PageSize' in tools['ECS_DescribeInstances'].parameters['properties']
+    assert not api_tools._LAZY_TOOLS
+
+
+@pytest.fixture
+def regions(monkeypatch, meta_session):
+    """按地域返回实例的上游调用，cn-shanghai 调用失败；返回记录的 (api, RegionId) 列表"""
+    calls = []
+
+    async def call(service, api, parameters, ctx):
+        region_id = parameters['RegionId']
+        calls.append((api, region_id))
+        if api == 'DescribeRegions':
+            return {'body': {'Regions': {'Region': [{'RegionId': 'cn-hangzhou'}, {'RegionId': 'cn-beijing'},
+                                                    {'RegionId': 'cn-shanghai'}]}}}
+        if region_id == 'cn-shanghai':
+            raise RuntimeError('Throttling')
+        instance = {'InstanceId': f'i-{region_id}', 'Status': 'Running'}
+        return {'headers': {}, 'body': {'RequestId': region_id, 'TotalCount': 1, 'Instances': {'Instance': [instance]}}}
+
+    monkeypatch.setattr(api_tools, '_call_api_async', call)
+    monkeypatch.setattr(api_tools, '_REGION_IDS', {})
+    return calls
+
+
+def test_fan_out_to_all_regions(regions):
+    result = asyncio.run(api_tools._tools_api_call_async('ecs', 'DescribeInstances', {'RegionId': '*'}, None))
+    asyncio.run(api_tools._tools_api_call_async('ecs', 'DescribeInstances', {'RegionId': '*'}, None))
+
+    assert result['RegionIds'] == ['cn-hangzhou', 'cn-beijing', 'cn-shanghai']
+    assert list(result['Results']) == ['cn-hangzhou', 'cn-beijing']
+    assert result['Errors'] == {'cn-shanghai': 'Throttling'}
+    # 地域列表按凭证缓存
+    assert [call for call in regions if call[0] == 'DescribeRegions'] == [('DescribeRegions', 'cn-hangzhou')]
+
+
+def test_fan_out_projects_each_region(regions):
+    parameters = {'RegionId': 'cn-beijing, cn-hangzhou', 'Projection': 'Instances.Instance.InstanceId'}
+
+    result = asyncio.run(api_tools._tools_api_call_async('ecs', 'DescribeInstances', parameters, None))
+
+    assert regions == [('DescribeInstances', 'cn-beijing'), ('DescribeInstances', 'cn-hangzhou')]
+    assert result['Results']['cn-beijing'] == {'body': {'Instances': {'Instance': [{'InstanceId': 'i-cn-beijing'}]}}}
+
+
+def test_single_region_is_not_fanned_out(regions):
+    result = asyncio.run(api_tools._tools_api_call_async('ecs', 'DescribeInstances', {'RegionId': 'cn-beijing'}, None))
+
+    assert result['body']['RequestId'] == 'cn-beijing'
+    assert 'headers' not in result
+
+
+def test_mutating_api_is_not_fanned_out(regions):
+    with pytest.raises(exception.MultiRegionNotSupported):
+        asyncio.run(api_tools._tools_api_call_async('ecs', 'StartInstances', {'RegionId': 'cn-beijing,cn-hangzhou'},
+                                                    None))
+    assert regions == []
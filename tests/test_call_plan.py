@@ -0,0 +1,33 @@
+import asyncio
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.pagination import PAGE_NUMBER
+from alibaba_cloud_ops_mcp_server.tools import api_tools
+
+from conftest import ECS_API_PATH
+
+
+def test_call_plan_is_built_from_api_meta(meta_session):
+    plan = api_tools.get_call_plan('ECS', 'describeinstances')
+
+    assert (plan.action, plan.version, plan.pathname, plan.method) == ('DescribeInstances', '2014-05-26', '/', 'POST')
+    assert plan.pagination == PAGE_NUMBER
+    assert plan.parameter_names == {'RegionId', 'InstanceIds', 'PageNumber', 'PageSize'}
+    assert plan.to_params().action == 'DescribeInstances'
+
+
+def test_call_plan_is_cached_per_service_and_api(meta_session):
+    plan = api_tools.get_call_plan('ecs', 'DescribeInstances')
+
+    assert api_tools.get_call_plan('Ecs', 'DESCRIBEINSTANCES') is plan
+    assert asyncio.run(api_tools.get_call_plan_async('ecs', 'describeInstances')) is plan
+    assert meta_session.paths.count(ECS_API_PATH.format('DescribeInstances')) == 1
+    assert api_tools.get_call_plan('ecs', 'DescribeRegions') is not plan
+
+
+def test_ecs_list_parameters_are_json_encoded(meta_session):
+    plan = api_tools.get_call_plan('ecs', 'DescribeInstances')
+
+    assert plan.encode_parameters({'InstanceIds': ['i-1', 'i-2'], 'RegionId': 'cn-hangzhou'}) == \
+        {'InstanceIds': '["i-1", "i-2"]', 'RegionId': 'cn-hangzhou'}
+    assert plan.encode_parameters({'InstanceIds': '["i-1"]'}) == {'InstanceIds': '["i-1"]'}
+
@@ -0,0 +1,132 @@
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.chunk_scheduler import ChunkScheduler
+
+
+def failing_first(calls, failures):
+    """按分片首个元素记录执行次数，failures 中的分片前若干次执行抛出异常"""
+
+    async def func(chunk):
+        key = chunk[0]
+        calls[key] = calls.get(key, 0) + 1
+        await asyncio.sleep(0)
+        if failures.get(key, 0) >= calls[key]:
+            raise RuntimeError(f'chunk {key} failed')
+        return f'ok-{key}'
+
+    return func
+
+
+def test_split():
+    scheduler = ChunkScheduler(chunk_size=2, rate=0)
+    assert scheduler.split([1, 2, 3, 4, 5]) == [[1, 2], [3, 4], [5]]
+
+
+def test_failed_chunks_are_not_retried_by_default():
+    scheduler = ChunkScheduler(chunk_size=2, rate=0)
+    calls = {}
+
+    results = asyncio.run(scheduler.run(range(1, 5), failing_first(calls, {1: 1})))
+
+    assert calls == {1: 1, 3: 1}
+    assert isinstance(results[0][2], RuntimeError)
+    assert results[1] == ([3, 4], 'ok-3', None)
+
+
+def test_retry_leaves_succeeded_chunks_alone():
+    scheduler = ChunkScheduler(chunk_size=2, max_concurrency=2, rate=0, max_retries=1)
+    calls = {}
+    done = []
+
+    async def on_done(chunk, result, error):
+        done.append((chunk, result, error))
+
+    results = asyncio.run(scheduler.run(range(1, 7), failing_first(calls, {3: 1}), on_done))
+
+    assert calls == {1: 1, 3: 2, 5: 1}
+    assert results == [([1, 2], 'ok-1', None), ([3, 4], 'ok-3', None), ([5, 6], 'ok-5', None)]
+    assert sorted(done) == sorted(results)
+
+
+def test_chunk_error_reported_once_after_retries_exhausted():
+    scheduler = ChunkScheduler(chunk_size=2, rate=0, max_retries=2)
+    calls = {}
+    done = []
+
+    async def on_done(chunk, result, error):
+        done.append((chunk, error))
+
+    (chunk, result, error), succeeded = asyncio.run(scheduler.run([1, 2, 3], failing_first(calls, {1: 5}), on_done))
+
+    assert calls == {1: 3, 3: 1}
+    assert chunk == [1, 2] and result is None and isinstance(error, RuntimeError)
+    assert succeeded == ([3], 'ok-3', None)
+    assert [chunk for chunk, _ in done].count([1, 2]) == 1
+
+
+def test_callback_error_does_not_retry_chunk():
+    scheduler = ChunkScheduler(chunk_size=1, rate=0, max_retries=1)
+    calls = {}
+
+    async def on_done(chunk, result, error):
+        raise ValueError('callback failed')
+
+    assert asyncio.run(scheduler.run([1], failing_first(calls, {}), on_done)) == [([1], 'ok-1', None)]
+    assert calls == {1: 1}
+
+
+def test_max_concurrency():
+    scheduler = ChunkScheduler(chunk_size=1, max_concurrency=2, rate=0)
+    running = peak = 0
+
+    async def func(chunk):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    asyncio.run(scheduler.run(range(6), func))
+
+    assert peak == 2
+
+
+def test_held_slot_is_released_when_future_completes():
+    scheduler = ChunkScheduler(chunk_size=1, max_concurrency=2, rate=0)
+    futures = {}
+    started = []
+
+    async def func(chunk):
+        started.append(chunk[0])
+        futures[chunk[0]] = Future()
+        return chunk[0]
+
+    async def main():
+        task = asyncio.ensure_future(scheduler.run(range(3), func, hold=futures.get))
+        await asyncio.sleep(0.01)
+        # 前两个分片的执行未结束，第三个分片等待名额
+        assert started == [0, 1]
+        futures[0].set_result(None)
+        await asyncio.sleep(0.01)
+        assert started == [0, 1, 2]
+        futures[1].set_result(None)
+        futures[2].set_result(None)
+        return await task
+
+    assert [result for _, result, _ in asyncio.run(main())] == [0, 1, 2]
+
+
+def test_cancelled_chunk_is_not_retried():
+    scheduler = ChunkScheduler(chunk_size=1, rate=0, max_retries=3)
+    calls = []
+
+    async def func(chunk):
+        calls.append(chunk)
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(scheduler.run([1], func))
+    assert calls == [[1]]
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.client_pool import ClientPool
+from alibaba_cloud_ops_mcp_server.tools import oos_tools
+
+
+def counting_factory():
+    """每次调用创建新 client 的工厂，calls 记录创建次数"""
+
+    def factory():
+        factory.calls += 1
+        return object()
+
+    factory.calls = 0
+    return factory
+
+
+def test_clients_are_reused_per_key():
+    pool = ClientPool()
+    factory = counting_factory()
+
+    client = pool.get(('ecs', 'cn-hangzhou'), factory)
+
+    assert pool.get(('ecs', 'cn-hangzhou'), factory) is client
+    assert pool.get(('ecs', 'cn-beijing'), factory) is not client
+    assert factory.calls == 2
+
+
+def test_least_recently_used_client_is_evicted():
+    pool = ClientPool(max_size=2)
+    factory = counting_factory()
+    first = pool.get('a', factory)
+    pool.get('b', factory)
+    pool.get('a', factory)
+    pool.get('c', factory)
+
+    assert len(pool) == 2
+    assert pool.get('a', factory) is first
+    pool.get('b', factory)
+    assert factory.calls == 4
+
+
+def test_idle_clients_expire():
+    pool = ClientPool(idle_timeout=0.01)
+    factory = counting_factory()
+    client = pool.get('a', factory)
+    time.sleep(0.02)
+
+    assert pool.get('a', factory) is not client
+    assert len(pool) == 1
+
+
+def test_zero_size_disables_pooling():
+    pool = ClientPool(max_size=0)
+    factory = counting_factory()
+
+    assert pool.get('a', factory) is not pool.get('a', factory)
+    assert len(pool) == 0
+
+
+def test_concurrent_first_use_shares_one_client():
+    pool = ClientPool()
+    barrier = threading.Barrier(4)
+    clients = []
+
+    def factory():
+        barrier.wait(timeout=5)
+        return object()
+
+    threads = [threading.Thread(target=lambda: clients.append(pool.get('a', factory))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 同时创建的 client 只有一个被放入连接池，之后的调用都复用它
+    assert pool.get('a', counting_factory()) in clients
+    assert len(pool) == 1
+
+
+def test_tool_clients_are_pooled_per_endpoint(monkeypatch):
+    monkeypatch.setattr(oos_tools, 'client_pool', ClientPool())
+
+    client = oos_tools.create_client('cn-hangzhou')
+
+    assert oos_tools.create_client('cn-hangzhou') is client
+    assert oos_tools.create_client('cn-beijing') is not client
+    assert oos_tools.create_ecs_client('cn-hangzhou') is not client
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.credential_cache import CachedCredentialsClient
+
+
+def sts_provider(*ttls):
+    """每次调用签发新 STS 凭证的 provider，有效期依次取 ttls（最后一个重复使用），calls 记录签发次数"""
+
+    def issue():
+        ttl = ttls[min(provider.calls, len(ttls) - 1)]
+        provider.calls += 1
+        provider.refreshed.set()
+        number = provider.calls
+        return SimpleNamespace(
+            get_access_key_id=lambda: f'STS.{number}',
+            get_access_key_secret=lambda: 'secret',
+            get_security_token=lambda: f'token-{number}',
+            get_provider_name=lambda: 'fake',
+            get_expiration=lambda: time.time() + ttl)
+
+    async def issue_async():
+        return issue()
+
+    provider = SimpleNamespace(get_credentials=issue, get_credentials_async=issue_async, calls=0,
+                               refreshed=threading.Event())
+    return provider
+
+
+def create_client(provider, refresh_ahead=300):
+    client = CachedCredentialsClient(refresh_ahead=refresh_ahead)
+    client.cloud_credential = SimpleNamespace(provider=provider, type_name='sts')
+    return client
+
+
+def test_credential_is_resolved_once():
+    provider = sts_provider(3600)
+    client = create_client(provider)
+
+    assert client.get_access_key_id() == 'STS.1'
+    assert client.get_security_token() == 'token-1'
+    assert asyncio.run(client.get_access_key_secret_async()) == 'secret'
+    assert provider.calls == 1
+
+
+def test_credential_near_expiry_is_refreshed_in_background():
+    provider = sts_provider(100, 3600)
+    client = create_client(provider, refresh_ahead=300)
+    client.get_credential()
+    provider.refreshed.clear()
+
+    # 旧凭证仍在有效期内，直接返回，同时后台刷新
+    assert client.get_access_key_id() == 'STS.1'
+    assert provider.refreshed.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while client.get_access_key_id() != 'STS.2' and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.get_access_key_id() == 'STS.2'
+    assert provider.calls == 2
+
+
+def test_expired_credential_is_refreshed_before_use():
+    provider = sts_provider(-1)
+    client = create_client(provider, refresh_ahead=0)
+
+    assert client.get_access_key_id() == 'STS.1'
+    assert asyncio.run(client.get_credential_async()).access_key_id == 'STS.2'
+    assert provider.calls == 2
@@ -0,0 +1,100 @@
+from concurrent.futures import CancelledError
+
+import pytest
+from alibabacloud_oos20190601 import models as oos_20190601_models
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.execution_poller import ExecutionPoller, MAX_BATCH_PAGES
+
+from conftest import START_DATE
+
+
+def create_poller():
+    return ExecutionPoller(initial_interval=0.01, max_interval=0.02, max_failures=2)
+
+
+def watch_all(poller, client, execution_ids, start_date=START_DATE):
+    return [poller.watch(client, 'cn-hangzhou', execution_id, start_date) for execution_id in execution_ids]
+
+
+def test_watches_in_same_region_are_polled_in_batch(oos_client):
+    execution_ids = ['exec-1', 'exec-2', 'exec-3']
+    for execution_id in execution_ids:
+        oos_client.set_status(execution_id, 'Success')
+
+    futures = watch_all(create_poller(), oos_client, execution_ids)
+
+    assert [future.result(timeout=5).status for future in futures] == ['Success'] * 3
+    assert len(oos_client.list_requests) == 1
+    request = oos_client.list_requests[0]
+    assert request.execution_id is None
+    assert (request.start_date_after, request.sort_field, request.sort_order) == (START_DATE, 'StartDate', 'Ascending')
+
+
+def test_batch_paging_is_capped_and_stragglers_are_queried_by_id(oos_client, monkeypatch):
+    list_executions = oos_client.list_executions
+    execution_ids = ['exec-1', 'exec-2']
+    for execution_id in execution_ids:
+        oos_client.set_status(execution_id, 'Success')
+
+    def list_busy_region(request):
+        if request.execution_id:
+            return list_executions(request)
+        # 地域内其他执行很多，批量查询始终翻不到被等待的执行
+        oos_client.list_requests.append(request)
+        other = oos_20190601_models.ListExecutionsResponseBodyExecutions(execution_id='other', status='Running')
+        body = oos_20190601_models.ListExecutionsResponseBody(executions=[other], next_token='more')
+        return oos_20190601_models.ListExecutionsResponse(body=body)
+
+    monkeypatch.setattr(oos_client, 'list_executions', list_busy_region)
+
+    futures = watch_all(create_poller(), oos_client, execution_ids)
+
+    assert [future.result(timeout=5).status for future in futures] == ['Success'] * 2
+    assert [request.execution_id for request in oos_client.list_requests
+            if request.execution_id is None] == [None] * MAX_BATCH_PAGES
+    assert sorted(request.execution_id for request in oos_client.list_requests if request.execution_id) == execution_ids
+
+
+def test_watch_resolves_when_execution_ends(oos_client):
+    oos_client.set_status('exec-1', 'Running')
+    poller = create_poller()
+    future = poller.watch(oos_client, 'cn-hangzhou', 'exec-1')
+    oos_client.set_status('exec-1', 'Failed')
+
+    execution = future.result(timeout=5)
+    assert execution.status == 'Failed'
+    assert poller.get_state(oos_client, 'exec-1') is execution
+
+
+def test_watch_missing_execution_raises_lookup_error(oos_client):
+    future = create_poller().watch(oos_client, 'cn-hangzhou', 'exec-1')
+
+    with pytest.raises(LookupError):
+        future.result(timeout=5)
+
+
+def test_watch_ended_execution_returns_resolved_future(oos_client):
+    poller = create_poller()
+    poller.remember(oos_client, oos_20190601_models.ListExecutionsResponseBodyExecutions(
+        execution_id='exec-1', status='Success'))
+
+    future = poller.watch(oos_client, 'cn-hangzhou', 'exec-1')
+    assert future.done()
+    assert future.result().status == 'Success'
+    assert not oos_client.list_requests
+
+
+def test_unwatch_cancels_future_and_stops_polling(oos_client):
+    oos_client.set_status('exec-1', 'Running')
+    poller = ExecutionPoller(initial_interval=60)
+    future = poller.watch(oos_client, 'cn-hangzhou', 'exec-1')
+    other = poller.watch(oos_client, 'cn-hangzhou', 'exec-1')
+
+    poller.unwatch('exec-1', future)
+    assert future.cancelled()
+    assert poller.is_watching('exec-1')
+    poller.unwatch('exec-1', other)
+    assert not poller.is_watching('exec-1')
+    with pytest.raises(CancelledError):
+        other.result(timeout=0)
+    assert not oos_client.list_requests
@@ -0,0 +1,84 @@
+import pytest
+import requests
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.api_meta_client import ApiMetaClient
+from alibaba_cloud_ops_mcp_server.alibabacloud.meta_cache import ApiMetaCache, FETCHED_AT
+
+PRODUCTS = 'products.json'
+
+
+def test_entries_persist_across_instances(tmp_path):
+    ApiMetaCache(cache_dir=str(tmp_path)).put(PRODUCTS, [{'code': 'Ecs'}], etag='"v1"')
+
+    entry = ApiMetaCache(cache_dir=str(tmp_path)).get(PRODUCTS)
+
+    assert entry['data'] == [{'code': 'Ecs'}]
+    assert ApiMetaCache.validators(entry) == {'If-None-Match': '"v1"'}
+
+
+def test_disabled_cache_stays_in_memory(tmp_path):
+    cache = ApiMetaCache(cache_dir=str(tmp_path), enabled=False)
+    cache.put(PRODUCTS, [])
+
+    assert cache.get(PRODUCTS)['data'] == []
+    assert ApiMetaCache(cache_dir=str(tmp_path)).get(PRODUCTS) is None
+
+
+def test_freshness_follows_ttl_of_meta_type(tmp_path):
+    cache = ApiMetaCache(cache_dir=str(tmp_path), ttls={'GetProductList': 60})
+    entry = cache.put(PRODUCTS, [])
+
+    assert cache.is_fresh(entry, 'GetProductList')
+    assert not cache.is_fresh(dict(entry, **{FETCHED_AT: entry[FETCHED_AT] - 61}), 'GetProductList')
+    assert not cache.is_fresh(entry, 'Unknown')
+
+
+def test_fresh_cache_skips_http(meta_session):
+    ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_PRODUCT_LIST)
+    ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_PRODUCT_LIST)
+
+    assert meta_session.paths == [PRODUCTS]
+
+
+def stale(monkeypatch, meta_session, response):
+    """写入过期的 products.json 缓存，之后的 HTTP 请求返回 response（异常则抛出）"""
+    ApiMetaClient.cache.put(PRODUCTS, [{'code': 'Cached'}], etag='"v1"')
+    monkeypatch.setitem(ApiMetaClient.cache.ttls, 'GetProductList', 0)
+    requests_headers = []
+
+    def get(url, headers=None, timeout=None):
+        requests_headers.append(headers)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(meta_session, 'get', get)
+    return requests_headers
+
+
+def http_response(status_code, content=b'{}'):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+def test_not_modified_revalidates_stale_cache(monkeypatch, meta_session):
+    headers = stale(monkeypatch, meta_session, http_response(304, b''))
+
+    assert ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_PRODUCT_LIST) == [{'code': 'Cached'}]
+    assert headers == [{'If-None-Match': '"v1"'}]
+
+
+@pytest.mark.parametrize('response', [http_response(500, b'{"Code": "InternalError"}'),
+                                      requests.exceptions.ConnectionError()])
+def test_errors_fall_back_to_stale_cache(monkeypatch, meta_session, response):
+    stale(monkeypatch, meta_session, response)
+
+    assert ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_PRODUCT_LIST) == [{'code': 'Cached'}]
+
+
+def test_error_body_is_never_returned_as_meta(meta_session):
+    with pytest.raises(Exception, match='Unexpected status code: 404'):
+        ApiMetaClient.get_response_from_pop_api(ApiMetaClient.GET_API_INFO, 'Ecs', 'NoSuchApi', '2014-05-26')
+    assert ApiMetaClient.cache.get('products/Ecs/versions/2014-05-26/apis/NoSuchApi/api.json') is None
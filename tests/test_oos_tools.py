@@ -0,0 +1,132 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from alibabacloud_ecs20140526 import models as ecs_20140526_models
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.chunk_scheduler import ChunkScheduler
+from alibaba_cloud_ops_mcp_server.alibabacloud.execution_poller import ExecutionPoller
+from alibaba_cloud_ops_mcp_server.tools import oos_tools
+
+
+@pytest.fixture
+def bulk(monkeypatch, oos_client):
+    """分片大小为 2、轮询间隔很短的 OOS 批量执行环境"""
+    monkeypatch.setattr(oos_tools, 'create_client', lambda region_id: oos_client)
+    monkeypatch.setattr(oos_tools, 'execution_poller', ExecutionPoller(initial_interval=0.01, max_interval=0.02))
+    monkeypatch.setattr(oos_tools, 'chunk_scheduler', ChunkScheduler(chunk_size=2, max_concurrency=2, rate=0))
+
+    def run(instance_ids, wait_for_completion=True):
+        parameters = {'targets': {'ResourceIds': instance_ids, 'Type': 'ResourceIds'}}
+        return asyncio.run(oos_tools._start_bulk_execution_async('cn-hangzhou', 'ACS-ECS-BulkyRunCommand', parameters,
+                                                                 wait_for_completion))
+
+    return run
+
+
+def test_failed_execution_is_reported_and_not_rerun(bulk, oos_client):
+    oos_client.execute = lambda ids: {instance_id: 'Failed' if instance_id == 'i-4' else 'Success'
+                                      for instance_id in ids}
+
+    result = bulk(['i-1', 'i-2', 'i-3', 'i-4', 'i-5'])
+
+    assert oos_client.started == [['i-1', 'i-2'], ['i-3', 'i-4'], ['i-5']]
+    failed = result['Executions'][1]
+    assert failed['ExecutionId'] == 'exec-2'
+    assert failed['Status'] == 'Failed'
+    assert failed['Instances'] == {'i-3': 'Success', 'i-4': 'Failed'}
+    assert result['SucceededInstanceIds'] == ['i-1', 'i-2', 'i-3', 'i-5']
+    assert result['FailedInstanceIds'] == ['i-4']
+    assert result['UnknownInstanceIds'] == []
+
+
+def test_start_execution_failure_is_reported_without_execution(bulk, oos_client, monkeypatch):
+    start_execution = oos_client.start_execution
+
+    def start(request):
+        if 'i-3' in request.parameters:
+            raise RuntimeError('StartExecution failed')
+        return start_execution(request)
+
+    monkeypatch.setattr(oos_client, 'start_execution', start)
+
+    result = bulk(['i-1', 'i-2', 'i-3'])
+
+    assert result['Executions'][1] == {'Status': 'Failed', 'Error': 'StartExecution failed', 'InstanceIds': ['i-3']}
+    assert result['FailedInstanceIds'] == ['i-3']
+
+
+def test_non_blocking_chunks_respect_max_concurrency(bulk, oos_client, monkeypatch):
+    start_execution = oos_client.start_execution
+    polls_before_start = []
+
+    def start(request):
+        polls_before_start.append(len(oos_client.list_requests))
+        return start_execution(request)
+
+    monkeypatch.setattr(oos_client, 'start_execution', start)
+
+    result = bulk(['i-1', 'i-2', 'i-3', 'i-4', 'i-5', 'i-6'], wait_for_completion=False)
+
+    assert [execution['ExecutionId'] for execution in result['Executions']] == ['exec-1', 'exec-2', 'exec-3']
+    # 第三个分片在前两个执行结束（被轮询到）后才启动
+    assert polls_before_start[:2] == [0, 0]
+    assert polls_before_start[2] > 0
+    assert result['SucceededInstanceIds'] == ['i-1', 'i-2', 'i-3', 'i-4', 'i-5', 'i-6']
+
+
+def test_direct_ecs_api_is_opt_in(bulk, oos_client, monkeypatch):
+    monkeypatch.setattr(oos_tools, 'create_ecs_client', lambda region_id: pytest.fail('ECS API called directly'))
+    tools = {tool.__name__: tool for tool in oos_tools.tools}
+
+    result = asyncio.run(tools['OOS_StartInstances'](['i-1'], 'cn-hangzhou', True))
+
+    assert oos_client.started == [['i-1']]
+    assert result.executions[0].status == 'Success'
+
+
+def test_direct_ecs_api_keeps_execution_shape(monkeypatch):
+    statuses = {'i-1': 'Stopped', 'i-2': 'Running', 'i-3': 'Stopped'}
+
+    def start_instances(request):
+        responses = []
+        for instance_id in request.instance_id:
+            if statuses[instance_id] == 'Running':
+                code, message = 'IncorrectInstanceStatus', 'The instance is already running.'
+            elif instance_id == 'i-3':
+                code, message = 'InvalidInstance.NotFound', 'The specified instance is not found.'
+            else:
+                code, message = '200', 'success'
+                statuses[instance_id] = 'Running'
+            responses.append(ecs_20140526_models.StartInstancesResponseBodyInstanceResponsesInstanceResponse(
+                instance_id=instance_id, code=code, message=message, current_status=statuses[instance_id]))
+        instance_responses = ecs_20140526_models.StartInstancesResponseBodyInstanceResponses(
+            instance_response=responses)
+        return ecs_20140526_models.StartInstancesResponse(
+            body=ecs_20140526_models.StartInstancesResponseBody(instance_responses=instance_responses))
+
+    def describe_instance_status(request):
+        instance_statuses = ecs_20140526_models.DescribeInstanceStatusResponseBodyInstanceStatuses(instance_status=[
+            ecs_20140526_models.DescribeInstanceStatusResponseBodyInstanceStatusesInstanceStatus(
+                instance_id=instance_id, status=statuses[instance_id]) for instance_id in request.instance_id])
+        return ecs_20140526_models.DescribeInstanceStatusResponse(
+            body=ecs_20140526_models.DescribeInstanceStatusResponseBody(instance_statuses=instance_statuses))
+
+    ecs_client = SimpleNamespace(start_instances=start_instances, describe_instance_status=describe_instance_status)
+    monkeypatch.setattr(oos_tools, 'create_ecs_client', lambda region_id: ecs_client)
+    monkeypatch.setattr(oos_tools, 'DIRECT_API_POLL_INTERVAL', 0.001)
+    monkeypatch.setattr(oos_tools, '_DIRECT_API_THRESHOLD', 10)
+    tools = {tool.__name__: tool for tool in oos_tools.tools}
+
+    result = asyncio.run(tools['OOS_StartInstances'](['i-1', 'i-2', 'i-3'], 'cn-hangzhou', True))
+
+    execution, = result.executions
+    assert execution.execution_id is None
+    assert execution.template_name == 'ACS-ECS-BulkyStartInstances'
+    assert execution.status == 'Failed'
+    instances = json.loads(execution.outputs)['Instances']
+    # 已处于 Running 的实例与 OOS 模板一致视为成功
+    assert {instance_id: instance['Status'] for instance_id, instance in instances.items()} == {
+        'i-1': 'Success', 'i-2': 'Success', 'i-3': 'Failed'}
+    assert instances['i-3']['Error'].startswith('InvalidInstance.NotFound')
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.pagination import (PAGE_NUMBER, NEXT_TOKEN, collect_items,
+                                                                 get_pagination_style, find_items_path)
+
+
+def paged_api(total_count, with_total_count=True, delay=0.0):
+    """PageNumber 风格的 API；requested 记录请求的页码，cancelled 记录被取消的页码"""
+
+    async def call(parameters):
+        page_number = int(parameters[PAGE_NUMBER])
+        page_size = int(parameters['PageSize'])
+        call.requested.append(page_number)
+        if page_number > 1:
+            try:
+                await asyncio.sleep(delay * (page_number - 1))
+            except asyncio.CancelledError:
+                call.cancelled.append(page_number)
+                raise
+        start = (page_number - 1) * page_size
+        body = {'Instances': {'Instance': list(range(start, min(total_count, start + page_size)))}}
+        if with_total_count:
+            body['TotalCount'] = total_count
+        return {'body': body}
+
+    call.requested = []
+    call.cancelled = []
+    return call
+
+
+def collect(call, max_items, style=PAGE_NUMBER, **parameters):
+    return asyncio.run(collect_items(call, style, dict({'PageSize': 10}, **parameters), max_items))['body']
+
+
+def test_get_pagination_style():
+    assert get_pagination_style({'PageNumber', 'PageSize', 'RegionId'}) == PAGE_NUMBER
+    assert get_pagination_style({'NextToken', 'MaxResults'}) == NEXT_TOKEN
+    assert get_pagination_style({'PageNumber'}) is None
+    assert get_pagination_style({'PageNumber', 'PageSize', 'MaxItems'}) is None
+
+
+def test_find_items_path():
+    assert find_items_path({'TotalCount': 1, 'Instances': {'Instance': []}}) == ('Instances', 'Instance')
+    assert find_items_path({'Executions': [], 'NextToken': 'x'}) == ('Executions',)
+    assert find_items_path({'RequestId': 'x'}) is None
+
+
+def test_prefetch_is_capped_by_max_items():
+    call = paged_api(total_count=250)
+
+    body = collect(call, 60, PageSize=50)
+
+    assert sorted(call.requested) == [1, 2]
+    assert body['ItemCount'] == 60
+    assert body['MaxItemsReached'] is True
+
+
+def test_prefetch_requests_only_pages_needed_for_max_items():
+    call = paged_api(total_count=100, delay=0.05)
+
+    body = collect(call, 35)
+
+    assert sorted(call.requested) == [1, 2, 3, 4]
+    assert body['Instances']['Instance'] == list(range(35))
+    assert body['MaxItemsReached'] is True
+    assert not call.cancelled
+
+
+def test_max_items_reached_only_when_items_remain():
+    assert collect(paged_api(total_count=30), 30)['MaxItemsReached'] is False
+    assert collect(paged_api(total_count=30), 40)['MaxItemsReached'] is False
+    assert collect(paged_api(total_count=30), 20)['MaxItemsReached'] is True
+    assert collect(paged_api(total_count=30), 10, PageNumber=3)['MaxItemsReached'] is False
+
+
+def test_pages_without_total_count_are_fetched_sequentially():
+    call = paged_api(total_count=25, with_total_count=False)
+
+    body = collect(call, 100)
+
+    assert call.requested == [1, 2, 3]
+    assert body['ItemCount'] == 25
+    assert body['MaxItemsReached'] is False
+
+
+def test_full_page_at_max_items_without_total_count():
+    call = paged_api(total_count=25, with_total_count=False)
+
+    body = collect(call, 20)
+
+    assert call.requested == [1, 2]
+    assert body['MaxItemsReached'] is True
+
+
+def test_next_token_pages_stop_at_max_items():
+    requests = []
+
+    async def call(parameters):
+        requests.append(dict(parameters))
+        page = int(parameters.get(NEXT_TOKEN) or 0)
+        return {'body': {'Executions': [page * 10 + i for i in range(10)], NEXT_TOKEN: str(page + 1)}}
+
+    body = collect(call, 20, style=NEXT_TOKEN, MaxResults=10)
+
+    assert body['ItemCount'] == 20
+    assert body['MaxItemsReached'] is True
+    assert NEXT_TOKEN not in body
+    assert len(requests) == 2
+
+
+@pytest.mark.parametrize('max_items', [1, 5])
+def test_single_page_response_keeps_structure(max_items):
+    body = collect(paged_api(total_count=3), max_items)
+
+    assert body['Instances']['Instance'] == [0, 1, 2][:max_items]
+    assert body['TotalCount'] == 3
@@ -0,0 +1,47 @@
+import pytest
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.projection import parse_projection, project, project_response
+
+INSTANCES = {
+    'RequestId': 'req-1',
+    'TotalCount': 2,
+    'Instances': {'Instance': [
+        {'InstanceId': 'i-1', 'Status': 'Running', 'VpcAttributes': {'VpcId': 'vpc-1', 'IpAddress': ['10.0.0.1']}},
+        {'InstanceId': 'i-2', 'Status': 'Stopped', 'VpcAttributes': {'VpcId': 'vpc-2', 'IpAddress': []}},
+    ]}
+}
+
+
+@pytest.mark.parametrize('expression, tree', [
+    ('TotalCount, Instances.Instance[*].InstanceId',
+     {'TotalCount': None, 'Instances': {'Instance': {'InstanceId': None}}}),
+    (['Instances.Instance[].Status', ' Instances '], {'Instances': None}),
+    ('Instances, Instances.Instance.Status', {'Instances': None}),
+    ('', {}),
+])
+def test_parse_projection(expression, tree):
+    assert parse_projection(expression) == tree
+
+
+def test_project_applies_to_each_list_element():
+    tree = parse_projection('TotalCount, Instances.Instance[*].InstanceId, Instances.Instance.VpcAttributes.VpcId')
+
+    assert project(INSTANCES, tree) == {'TotalCount': 2, 'Instances': {'Instance': [
+        {'InstanceId': 'i-1', 'VpcAttributes': {'VpcId': 'vpc-1'}},
+        {'InstanceId': 'i-2', 'VpcAttributes': {'VpcId': 'vpc-2'}},
+    ]}}
+
+
+def test_project_response_drops_headers():
+    response = {'headers': {'x-acs-request-id': 'req-1'}, 'statusCode': 200, 'body': INSTANCES}
+
+    assert project_response(response) == {'statusCode': 200, 'body': INSTANCES}
+
+
+def test_project_response_keeps_pagination_fields():
+    body = dict(INSTANCES, ItemCount=2, MaxItemsReached=True)
+
+    projected = project_response({'statusCode': 200, 'body': body}, 'Instances.Instance.InstanceId')
+
+    assert projected['body'] == {'Instances': {'Instance': [{'InstanceId': 'i-1'}, {'InstanceId': 'i-2'}]},
+                                 'ItemCount': 2, 'MaxItemsReached': True}
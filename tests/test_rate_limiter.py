@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+import pytest
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.rate_limiter import TokenBucket, RateLimiter
+
+
+class ThrottlingError(Exception):
+    code = 'Throttling.User'
+
+
+def throttled_api(throttled=0):
+    """前 throttled 次调用返回限流错误的 API 调用，calls 记录调用次数"""
+
+    def call_api():
+        call_api.calls += 1
+        if call_api.calls <= throttled:
+            raise ThrottlingError('Request was denied due to user flow control.')
+        return {'statusCode': 200}
+
+    call_api.calls = 0
+    return call_api
+
+
+def test_bucket_allows_burst_then_queues():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(0.1, abs=0.02)
+    assert bucket._reserve() == pytest.approx(0.2, abs=0.02)
+
+
+def test_throttling_decreases_rate_to_min_rate():
+    bucket = TokenBucket(rate=8, min_rate=1)
+    bucket.on_throttled()
+    assert bucket.rate == 4
+    for _ in range(5):
+        bucket.on_throttled()
+    assert bucket.rate == 1
+
+
+def test_rate_recovers_after_recovery_interval():
+    bucket = TokenBucket(rate=10, recovery_ratio=0.5, recovery_interval=0.05)
+    bucket.on_throttled()
+    assert bucket.rate == 5
+    bucket.on_success()
+    assert bucket.rate == 5
+    time.sleep(0.06)
+    bucket.on_success()
+    assert bucket.rate == 10
+    time.sleep(0.06)
+    bucket.on_success()
+    assert bucket.rate == 10
+
+
+def test_acquire_async_waits_for_token():
+    bucket = TokenBucket(rate=20, burst=1)
+
+    async def main():
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire_async()
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 0.09
+
+
+def test_rate_limiter_throttling_and_recovery():
+    limiter = RateLimiter(default_rate=100)
+    call_api = throttled_api(throttled=2)
+    for _ in range(2):
+        with pytest.raises(ThrottlingError):
+            limiter.call('ecs', 'cn-hangzhou', 'DescribeInstances', call_api)
+    bucket = limiter.get_bucket('ecs', 'cn-hangzhou', 'DescribeInstances')
+    assert bucket.rate == 25
+    # 其他地域和 API 不受影响
+    assert limiter.get_bucket('ecs', 'cn-beijing', 'DescribeInstances').rate == 100
+
+    bucket.recovery_interval = 0
+    assert limiter.call('ecs', 'cn-hangzhou', 'DescribeInstances', call_api) == {'statusCode': 200}
+    assert bucket.rate == 35
+
+
+def test_rate_limiter_quotas():
+    limiter = RateLimiter(default_rate=50, quotas={'ecs': 20, 'ecs.RunInstances': 5, 'oos': 0})
+    assert limiter.get_rate('ECS', 'DescribeInstances') == 20
+    assert limiter.get_rate('ecs', 'RunInstances') == 5
+    assert limiter.get_rate('vpc', 'DescribeVpcs') == 50
+    assert limiter.get_bucket('oos', 'cn-hangzhou', 'ListExecutions') is None
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.response_cache import (ResponseCache, is_read_only_api,
+                                                                     make_request_key)
+
+
+def key(api='DescribeInstances', region_id='cn-hangzhou', service='ecs', **parameters):
+    return make_request_key('default', service, region_id, api, parameters)
+
+
+@pytest.mark.parametrize('api, read_only', [
+    ('DescribeInstances', True), ('ListTagResources', True), ('GetBucketInfo', True),
+    ('StartInstances', False), ('DeleteInstance', False),
+])
+def test_is_read_only_api(api, read_only):
+    assert is_read_only_api(api) is read_only
+
+
+def test_request_key_ignores_parameter_order_and_none_values():
+    assert key(PageSize=10, InstanceIds=None, RegionId='cn-hangzhou') == key(RegionId='cn-hangzhou', PageSize=10)
+    assert key(PageSize=10) != key(PageSize=20)
+    assert key(service='ECS', region_id='CN-HANGZHOU') == key()
+
+
+def test_disabled_by_default():
+    cache = ResponseCache()
+
+    assert not cache.enabled
+    cache.put(key(), {'RequestId': 'req-1'}, cache.get_ttl('ecs', 'DescribeInstances'))
+    assert cache.get(key()) is None
+
+
+def test_ttl_per_api_and_expiry():
+    cache = ResponseCache(ttls={'DescribeRegions': 3600, 'ecs.DescribeInstances': 0.05})
+
+    assert cache.enabled
+    assert cache.get_ttl('ECS', 'DescribeInstances') == 0.05
+    assert cache.get_ttl('vpc', 'DescribeRegions') == 3600
+    assert cache.get_ttl('ecs', 'DescribeImages') == 0
+
+    cache.put(key(), {'RequestId': 'req-1'}, cache.get_ttl('ecs', 'DescribeInstances'))
+    assert cache.get(key()) == {'RequestId': 'req-1'}
+    time.sleep(0.06)
+    assert cache.get(key()) is None
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache(max_entries=2, default_ttl=60)
+    for page_number in (1, 2):
+        cache.put(key(PageNumber=page_number), page_number, 60)
+    cache.get(key(PageNumber=1))
+    cache.put(key(PageNumber=3), 3, 60)
+
+    assert cache.get(key(PageNumber=1)) == 1
+    assert cache.get(key(PageNumber=2)) is None
+    assert len(cache) == 2
+
+
+def test_invalidate_by_service_and_region():
+    cache = ResponseCache(default_ttl=60)
+    for service, region_id in (('ecs', 'cn-hangzhou'), ('ecs', 'cn-beijing'), ('vpc', 'cn-hangzhou')):
+        cache.put(key(service=service, region_id=region_id), service, 60)
+
+    cache.invalidate('ECS', 'cn-hangzhou')
+    assert cache.get(key()) is None
+    assert cache.get(key(region_id='cn-beijing')) == 'ecs'
+
+    cache.invalidate('ecs')
+    assert cache.get(key(region_id='cn-beijing')) is None
+    assert cache.get(key(service='vpc')) == 'vpc'
@@ -0,0 +1,138 @@
+import asyncio
+import inspect
+
+import pytest
+import requests
+
+from alibaba_cloud_ops_mcp_server.alibabacloud import retry
+from alibaba_cloud_ops_mcp_server.alibabacloud.retry import (RetryPolicy, classify_error, THROTTLING, SERVER_ERROR,
+                                                            CONNECTION, TIMEOUT)
+from alibaba_cloud_ops_mcp_server.tools import api_tools, cms_tools
+
+
+class CloudError(Exception):
+
+    def __init__(self, code=None, status_code=None):
+        super().__init__(code)
+        self.code = code
+        self.statusCode = status_code
+
+
+def flaky(errors, result='ok'):
+    """依次抛出 errors 中的异常，之后返回 result；calls 记录调用次数"""
+    errors = list(errors)
+
+    def func():
+        func.calls += 1
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    func.calls = 0
+    return func
+
+
+@pytest.mark.parametrize('error, kind', [
+    (CloudError('Throttling.User', 400), THROTTLING),
+    (CloudError('Anything', 429), THROTTLING),
+    (CloudError('ServiceUnavailable', 503), SERVER_ERROR),
+    (CloudError('InternalError'), SERVER_ERROR),
+    (requests.exceptions.ConnectionError(), CONNECTION),
+    (requests.exceptions.ReadTimeout(), TIMEOUT),
+    (CloudError('InvalidParameter', 400), None),
+    (ValueError('bad'), None),
+])
+def test_classify_error(error, kind):
+    assert classify_error(error) == kind
+
+
+def test_retryable_errors_are_retried():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+    func = flaky([CloudError('Throttling'), CloudError('ServiceUnavailable', 503)])
+
+    assert policy.call(func) == 'ok'
+    assert func.calls == 3
+    assert policy.stats['retries'] == 2
+
+
+def test_attempts_are_capped():
+    policy = RetryPolicy(max_attempts=2, base_delay=0.001)
+    func = flaky([CloudError('Throttling')] * 3)
+
+    with pytest.raises(CloudError):
+        policy.call(func)
+    assert func.calls == 2
+    assert policy.stats['exhausted'] == 1
+
+
+def test_non_retryable_and_non_idempotent_calls_fail_fast():
+    policy = RetryPolicy(base_delay=0.001)
+    func = flaky([CloudError('InvalidParameter', 400)])
+    with pytest.raises(CloudError):
+        policy.call(func)
+    assert func.calls == 1
+
+    func = flaky([CloudError('Throttling')])
+    with pytest.raises(CloudError):
+        policy.call(func, idempotent=False)
+    assert func.calls == 1
+
+
+def test_retry_stops_at_deadline(monkeypatch):
+    monkeypatch.setattr(retry.random, 'uniform', lambda low, high: high)
+    policy = RetryPolicy(max_attempts=10, base_delay=1, max_delay=1, deadline=0.01)
+    func = flaky([CloudError('Throttling')] * 10)
+
+    with pytest.raises(CloudError):
+        policy.call(func)
+    assert func.calls == 1
+
+
+def test_call_async_backs_off_without_blocking_loop(monkeypatch):
+    monkeypatch.setattr(retry.random, 'uniform', lambda low, high: high)
+    policy = RetryPolicy(max_attempts=3, base_delay=0.05, max_delay=0.05)
+    func = flaky([CloudError('Throttling')] * 2)
+    ticks = []
+
+    async def call():
+        return func()
+
+    async def ticker():
+        while func.calls < 3:
+            ticks.append(func.calls)
+            await asyncio.sleep(0.005)
+
+    async def main():
+        return (await asyncio.gather(policy.call_async(call), ticker()))[0]
+
+    assert asyncio.run(main()) == 'ok'
+    assert func.calls == 3
+    assert len(ticks) > 2
+
+
+def test_cms_tools_retry_on_the_async_path(monkeypatch):
+    class Datapoints:
+        calls = 0
+
+        def describe_metric_last(self, request):
+            self.calls += 1
+            if self.calls == 1:
+                raise CloudError('Throttling')
+            return type('Response', (), {'body': type('Body', (), {'datapoints': '[]'})()})()
+
+    client = Datapoints()
+    monkeypatch.setattr(cms_tools, 'create_client', lambda region_id: client)
+    tools = {tool.__name__: tool for tool in cms_tools.tools}
+
+    assert all(inspect.iscoroutinefunction(tool) for tool in tools.values())
+    assert asyncio.run(tools['CMS_GetCpuUsageData'](['i-1'], 'cn-hangzhou')) == '[]'
+    assert client.calls == 2
+
+
+def test_mutating_api_calls_get_client_token(meta_session):
+    plan = api_tools.get_call_plan('ecs', 'StartInstances')
+
+    # 携带 ClientToken 的变更类调用是幂等的，可以安全重试
+    assert api_tools._with_client_token(plan, {'RegionId': 'cn-hangzhou'})['ClientToken']
+    assert api_tools._with_client_token(plan, {'ClientToken': 'token'}) == {'ClientToken': 'token'}
+    assert 'ClientToken' not in api_tools._with_client_token(api_tools.get_call_plan('ecs', 'DescribeRegions'), {})
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from alibaba_cloud_ops_mcp_server.alibabacloud.single_flight import SingleFlight
+
+
+def upstream_call():
+    """在 release 被设置后返回的上游调用，calls/cancelled 记录调用与取消次数"""
+
+    async def upstream():
+        upstream.calls += 1
+        try:
+            await upstream.release.wait()
+        except asyncio.CancelledError:
+            upstream.cancelled += 1
+            raise
+        return {'RequestId': upstream.calls}
+
+    upstream.calls = 0
+    upstream.cancelled = 0
+    upstream.release = None
+    return upstream
+
+
+def test_concurrent_calls_share_one_upstream_request():
+    single_flight = SingleFlight()
+    upstream = upstream_call()
+
+    async def main():
+        upstream.release = asyncio.Event()
+        waiters = [asyncio.ensure_future(single_flight.do('key', upstream)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(single_flight) == 1
+        upstream.release.set()
+        return await asyncio.gather(*waiters)
+
+    results = asyncio.run(main())
+
+    assert upstream.calls == 1
+    assert results == [{'RequestId': 1}] * 5
+    assert len(single_flight) == 0
+
+
+def test_different_keys_are_not_shared():
+    single_flight = SingleFlight()
+    upstream = upstream_call()
+
+    async def main():
+        upstream.release = asyncio.Event()
+        upstream.release.set()
+        return await asyncio.gather(single_flight.do('a', upstream), single_flight.do('b', upstream))
+
+    asyncio.run(main())
+
+    assert upstream.calls == 2
+
+
+def test_cancelling_one_waiter_keeps_upstream_running():
+    single_flight = SingleFlight()
+    upstream = upstream_call()
+
+    async def main():
+        upstream.release = asyncio.Event()
+        first = asyncio.ensure_future(single_flight.do('key', upstream))
+        second = asyncio.ensure_future(single_flight.do('key', upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        upstream.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == {'RequestId': 1}
+    assert upstream.calls == 1
+    assert upstream.cancelled == 0
+
+
+def test_cancelling_all_waiters_cancels_upstream():
+    single_flight = SingleFlight()
+    upstream = upstream_call()
+
+    async def main():
+        upstream.release = asyncio.Event()
+        waiters = [asyncio.ensure_future(single_flight.do('key', upstream)) for _ in range(3)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert upstream.cancelled == 1
+    assert len(single_flight) == 0
+
+
+def test_upstream_error_is_shared_and_not_cached():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0)
+        raise RuntimeError('upstream failed')
+
+    async def main():
+        results = await asyncio.gather(single_flight.do('key', failing), single_flight.do('key', failing),
+                                       return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        with pytest.raises(RuntimeError):
+            await single_flight.do('key', failing)
+
+    asyncio.run(main())
+
+    assert len(calls) == 2